@@ -1,16 +1,23 @@
 import streamlit as st
 import os
+from datetime import date, timedelta
 
 # Try to import functions from indexer with error handling
 try:
-    from indexer import initialize_model, search_tfidf, search_bm25, MODEL_FILE
+    from indexer import initialize_model, SearchCursor, record_access, publish_date_range, MODEL_FILE, LSA_ENABLED
     BM25_AVAILABLE = True
 except ImportError as e:
     st.error(f"Error importing from indexer: {str(e)}")
-    st.error("Please make sure all required libraries are installed: pip install rank-bm25")
+    st.error("Please make sure all required libraries are installed: pip install -r requirements.txt")
     st.stop()
     BM25_AVAILABLE = False
 
+# Jumlah hasil per halaman untuk setiap metode
+PAGE_SIZE = 5
+
+# st.fragment memungkinkan navigasi halaman tanpa menjalankan ulang seluruh script
+fragment = getattr(st, "fragment", lambda func: func)
+
 st.set_page_config(
     page_title="Sistem Pencarian Artikel DISPMD Buleleng",
     page_icon="🔍",
@@ -41,6 +48,7 @@ with st.sidebar:
                 if os.path.exists(MODEL_FILE):
                     os.remove(MODEL_FILE)
                     st.session_state.model_initialized = False
+                    st.session_state.pop('search_key', None)
                     st.success("Model lama berhasil dihapus!")
                     st.rerun()
     else:
@@ -57,6 +65,41 @@ with st.sidebar:
         help="Semakin tinggi nilai, semakin besar pengaruh kemiripan konten. Semakin rendah, semakin besar pengaruh popularitas artikel."
     )
     
+    st.markdown("---")
+    st.markdown("### 📅 Tanggal Terbit")
+    
+    # Filter rentang tanggal diterapkan saat penelusuran posting, bukan setelah top-k
+    date_from, date_to = None, None
+    if st.checkbox("Batasi rentang tanggal"):
+        # Default satu tahun terakhir dihitung dari artikel terbaru di corpus, bukan hari ini
+        bounds = publish_date_range()
+        first, last = bounds if bounds else (None, date.today())
+        date_range = st.date_input(
+            "Rentang tanggal terbit",
+            value=(max(last - timedelta(days=365), first or date.min), last),
+            min_value=first,
+            max_value=last
+        )
+        if len(date_range) == 2:
+            date_from, date_to = date_range
+    
+    half_life = None
+    if st.checkbox("Utamakan artikel terbaru"):
+        half_life = st.slider(
+            "Half-life (hari)",
+            min_value=7,
+            max_value=730,
+            value=180,
+            help="Skor artikel berkurang setengah setiap kali umurnya bertambah sebanyak nilai ini."
+        )
+    
+    st.markdown("---")
+    collapse_duplicates = st.checkbox(
+        "Sembunyikan artikel duplikat",
+        value=False,
+        help="Rilis yang dipublikasikan ulang hampir identik hanya ditampilkan sekali."
+    )
+    
     st.markdown("---")
     st.markdown("### 📊 Informasi Model")
     if st.session_state.model_initialized:
@@ -83,98 +126,102 @@ query = st.text_input(
     help="Masukkan kata kunci yang ingin Anda cari dalam artikel"
 )
 
+# Reset cursor dan halaman setiap kali query, bobot atau filter berubah
+search_key = (query, alpha, date_from, date_to, half_life, collapse_duplicates)
+if st.session_state.get('search_key') != search_key:
+    st.session_state.search_key = search_key
+    st.session_state.cursors = {}
+    st.session_state.page_tfidf = 1
+    st.session_state.page_bm25 = 1
+    st.session_state.page_lsa = 1
+
+def get_cursor(method):
+    """Mengambil cursor hasil pencarian yang tersimpan di session state."""
+    cursors = st.session_state.cursors
+    if method not in cursors:
+        cursors[method] = SearchCursor(query, method, alpha, page_size=PAGE_SIZE,
+                                       date_from=date_from, date_to=date_to, half_life=half_life,
+                                       collapse_duplicates=collapse_duplicates)
+    return cursors[method]
+
+def change_page(page_key, step):
+    st.session_state[page_key] += step
+
+@fragment
+def render_results(method, score_label):
+    """Menampilkan satu halaman hasil pencarian.
+    
+    Berpindah halaman hanya menjalankan ulang fragment ini dan membaca hasil
+    dari cursor, tanpa menghitung ulang skor atau merender halaman lain.
+    """
+    cursor = get_cursor(method)
+    page_key = f"page_{method}"
+    page = st.session_state[page_key]
+    results = cursor.page(page)
+    
+    if not results:
+        st.warning(f"Tidak ditemukan hasil yang sesuai dengan {score_label}.")
+        return
+    
+    first_rank = (page - 1) * PAGE_SIZE + 1
+    for rank, (doc_id, judul, url, score, access_count, combined_score) in enumerate(results, first_rank):
+        st.markdown(f"**#{rank}. [{judul}]({url})**")
+        st.caption(
+            f"{score_label} Score: {score:.4f} · Akses: {access_count} · Skor Akhir: {combined_score:.4f}"
+        )
+        # Streamlit tidak dapat mendeteksi klik pada link judul, sehingga akses dicatat
+        # manual lewat tombol ini langsung ke counter popularitas, tanpa membangun ulang model
+        st.button("👁️ Catat akses", key=f"access_{method}_{doc_id}", on_click=record_access, args=(doc_id,),
+                  help="Menambah jumlah akses artikel ini (membuka link judul tidak tercatat otomatis)")
+        st.markdown("---")
+    
+    # Navigasi halaman
+    nav_prev, nav_info, nav_next = st.columns([1, 2, 1])
+    with nav_prev:
+        st.button("⬅️", key=f"prev_{method}", disabled=page <= 1,
+                  on_click=change_page, args=(page_key, -1))
+    with nav_info:
+        st.caption(f"Halaman {page} dari {cursor.num_pages()}")
+    with nav_next:
+        st.button("➡️", key=f"next_{method}", disabled=page >= cursor.num_pages(),
+                  on_click=change_page, args=(page_key, 1))
+
 if query:
     with st.spinner("🔍 Mencari artikel..."):
         try:
-            # Melakukan pencarian dengan kedua metode
-            tfidf_results = search_tfidf(query, alpha)
-            bm25_results = search_bm25(query, alpha)
-            
-            # Membuat dua kolom untuk menampilkan hasil
-            col1, col2 = st.columns(2)
+            # Membuat kolom untuk setiap metode pencarian
+            if LSA_ENABLED:
+                col1, col2, col3 = st.columns(3)
+            else:
+                col1, col2 = st.columns(2)
             
             # Hasil TF-IDF
             with col1:
                 st.subheader("📈 Hasil Pencarian TF-IDF")
                 st.markdown("*Menggunakan algoritma Term Frequency-Inverse Document Frequency*")
-                
-                if not tfidf_results:
-                    st.warning("Tidak ditemukan hasil yang sesuai dengan TF-IDF.")
-                else:
-                    for i, (judul, url, sim_score, access_count, combined_score) in enumerate(tfidf_results, 1):
-                        with st.container():
-                            st.markdown(f"**#{i}. [{judul}]({url})**")
-                            
-                            # Metrik dalam satu baris
-                            metric_col1, metric_col2, metric_col3 = st.columns(3)
-                            
-                            with metric_col1:
-                                st.metric(
-                                    "TF-IDF Score",
-                                    f"{sim_score:.4f}",
-                                    help="Skor kemiripan TF-IDF"
-                                )
-                            
-                            with metric_col2:
-                                st.metric(
-                                    "Akses",
-                                    f"{access_count}",
-                                    help="Jumlah akses artikel"
-                                )
-                            
-                            with metric_col3:
-                                st.metric(
-                                    "Skor Akhir",
-                                    f"{combined_score:.4f}",
-                                    help="Skor kombinasi"
-                                )
-                            
-                            st.markdown("---")
+                render_results('tfidf', "TF-IDF")
             
             # Hasil BM25
             with col2:
                 st.subheader("🎯 Hasil Pencarian BM25")
                 st.markdown("*Menggunakan algoritma Best Matching 25*")
-                
-                if not bm25_results:
-                    st.warning("Tidak ditemukan hasil yang sesuai dengan BM25.")
-                else:
-                    for i, (judul, url, bm25_score, access_count, combined_score) in enumerate(bm25_results, 1):
-                        with st.container():
-                            st.markdown(f"**#{i}. [{judul}]({url})**")
-                            
-                            # Metrik dalam satu baris
-                            metric_col1, metric_col2, metric_col3 = st.columns(3)
-                            
-                            with metric_col1:
-                                st.metric(
-                                    "BM25 Score",
-                                    f"{bm25_score:.4f}",
-                                    help="Skor BM25"
-                                )
-                            
-                            with metric_col2:
-                                st.metric(
-                                    "Akses",
-                                    f"{access_count}",
-                                    help="Jumlah akses artikel"
-                                )
-                            
-                            with metric_col3:
-                                st.metric(
-                                    "Skor Akhir",
-                                    f"{combined_score:.4f}",
-                                    help="Skor kombinasi"
-                                )
-                            
-                            st.markdown("---")
+                render_results('bm25', "BM25")
+            
+            # Hasil LSA
+            if LSA_ENABLED:
+                with col3:
+                    st.subheader("🧠 Hasil Pencarian Semantik (LSA)")
+                    st.markdown("*Menggunakan Latent Semantic Analysis dengan approximate nearest neighbour*")
+                    render_results('lsa', "LSA")
             
             # Informasi tambahan
             st.markdown("---")
             st.info(
                 "💡 **Tips:** TF-IDF lebih fokus pada frekuensi kata dalam dokumen, "
                 "sedangkan BM25 lebih baik dalam menangani dokumen dengan panjang yang bervariasi. "
-                "Bandingkan hasil kedua metode untuk mendapatkan perspektif yang lebih lengkap."
+                + ("LSA menemukan artikel dengan topik serupa walaupun tidak memuat kata kunci yang sama. "
+                   if LSA_ENABLED else "")
+                + "Bandingkan hasil setiap metode untuk mendapatkan perspektif yang lebih lengkap."
             )
             
         except Exception as e:
@@ -190,9 +237,10 @@ else:
         
         1. **Masukkan Kata Kunci**: Ketik kata kunci yang ingin Anda cari di kotak pencarian
         2. **Atur Bobot**: Gunakan slider di sidebar untuk mengatur bobot antara relevansi konten dan popularitas
-        3. **Lihat Hasil**: Sistem akan menampilkan hasil dari dua metode:
+        3. **Lihat Hasil**: Sistem akan menampilkan hasil dari tiga metode:
            - **TF-IDF**: Metode klasik yang fokus pada frekuensi kata
            - **BM25**: Metode modern yang lebih baik untuk dokumen dengan panjang bervariasi
+           - **LSA**: Pencarian semantik yang menemukan artikel dengan topik serupa walaupun tidak memuat kata kunci yang sama (jika LSA diaktifkan)
         
         ### Contoh Kata Kunci:
         - `ekonomi desa`
@@ -202,7 +250,7 @@ else:
         - `program pemerintah`
         
         ### Interpretasi Skor:
-        - **TF-IDF/BM25 Score**: Skor relevansi berdasarkan algoritma masing-masing
+        - **TF-IDF/BM25/LSA Score**: Skor relevansi berdasarkan algoritma masing-masing
         - **Akses**: Jumlah kali artikel diakses (indikator popularitas)
         - **Skor Akhir**: Kombinasi dari relevansi dan popularitas berdasarkan bobot yang dipilih
         
@@ -217,7 +265,7 @@ else:
         
         **Keterangan:**
         - **α (alpha)**: Bobot relevansi konten (0.0 - 1.0)
-        - **Similarity Score**: Skor kemiripan TF-IDF/BM25 (0.0 - 1.0)
+        - **Similarity Score**: Skor kemiripan TF-IDF/BM25/LSA (0.0 - 1.0)
         - **Normalized Access Count**: Jumlah akses yang dinormalisasi (0.0 - 1.0)
         
         **Contoh Perhitungan:**
@@ -0,0 +1,130 @@
+import re
+import numpy as np
+from datetime import date, timedelta
+
+# Nama bulan Bahasa Indonesia (termasuk singkatan dan ejaan lama) ke nomor bulan
+BULAN = {
+    'januari': 1, 'jan': 1,
+    'februari': 2, 'pebruari': 2, 'feb': 2, 'peb': 2,
+    'maret': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'mei': 5,
+    'juni': 6, 'jun': 6,
+    'juli': 7, 'jul': 7,
+    'agustus': 8, 'agu': 8, 'agt': 8, 'ags': 8,
+    'september': 9, 'sep': 9, 'sept': 9,
+    'oktober': 10, 'okt': 10,
+    'november': 11, 'nopember': 11, 'nov': 11, 'nop': 11,
+    'desember': 12, 'des': 12
+}
+
+# Nilai kolom tanggal untuk artikel yang tanggalnya tidak dapat diparse
+UNKNOWN_DATE = -1
+
+EPOCH = date(1970, 1, 1)
+
+def extract_publish_date(tanggal):
+    """Mengekstrak tanggal terbit dari string tanggal.
+
+    Args:
+        tanggal (str): String tanggal, misal "Admin dispmd |  28 Mei 2025 |  62 kali"
+
+    Returns:
+        datetime.date: Tanggal terbit, None jika tidak ditemukan
+    """
+    try:
+        # Format "28 Mei 2025"
+        for day, month, year in re.findall(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})', tanggal):
+            if month.lower() in BULAN:
+                return date(int(year), BULAN[month.lower()], int(day))
+        # Format ISO "2025-05-28"
+        match = re.search(r'(\d{4})-(\d{2})-(\d{2})', tanggal)
+        if match:
+            return date(*map(int, match.groups()))
+        return None
+    except (TypeError, ValueError):
+        return None
+
+def from_days(days):
+    """Mengubah jumlah hari sejak 1970-01-01 menjadi date."""
+    return EPOCH + timedelta(days=int(days))
+
+def to_days(value):
+    """Mengubah date atau string ISO menjadi jumlah hari sejak 1970-01-01."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return (value - EPOCH).days
+
+class DateIndex:
+    """Kolom tanggal terbit dengan index sekunder terurut.
+
+    Tanggal disimpan sebagai int32 (hari sejak 1970-01-01). Doc-id diurutkan
+    menurut tanggal sehingga filter rentang tanggal cukup dua binary search
+    yang menghasilkan bitset dokumen.
+    """
+
+    def __init__(self, days):
+        """
+        Args:
+            days (list): Tanggal terbit setiap dokumen dalam hari, UNKNOWN_DATE jika tidak ada
+        """
+        self.days = np.asarray(days, dtype=np.int32)
+        known = np.flatnonzero(self.days != UNKNOWN_DATE)
+        order = known[np.argsort(self.days[known], kind='stable')]
+        self.sorted_docs = order.astype(np.int32)
+        self.sorted_days = self.days[order]
+
+    @classmethod
+    def from_articles(cls, articles):
+        """Membangun index dari field 'tanggal' setiap artikel."""
+        days = []
+        for a in articles:
+            published = extract_publish_date(a.get('tanggal', ''))
+            days.append(to_days(published) if published else UNKNOWN_DATE)
+        return cls(days)
+
+    def range_mask(self, date_from=None, date_to=None):
+        """Membuat bitset dokumen yang terbit di antara dua tanggal (inklusif).
+
+        Args:
+            date_from (date | str): Batas awal, None berarti tanpa batas
+            date_to (date | str): Batas akhir, None berarti tanpa batas
+
+        Returns:
+            np.ndarray: Bitset boolean per dokumen, artikel tanpa tanggal tidak termasuk
+        """
+        lo = 0 if date_from is None else np.searchsorted(self.sorted_days, to_days(date_from), side='left')
+        hi = len(self.sorted_days) if date_to is None else np.searchsorted(self.sorted_days, to_days(date_to), side='right')
+        mask = np.zeros(len(self.days), dtype=bool)
+        mask[self.sorted_docs[lo:hi]] = True
+        return mask
+
+    def recency_decay(self, half_life, today=None):
+        """Menghitung faktor decay eksponensial berdasarkan umur artikel.
+
+        Args:
+            half_life (float): Umur (hari) saat skor tinggal setengah
+            today (date): Tanggal acuan, default hari ini
+
+        Returns:
+            np.ndarray: Faktor 0-1 per dokumen, 0 untuk artikel tanpa tanggal
+        """
+        today = to_days(today or date.today())
+        age = np.maximum(today - self.days, 0)
+        decay = np.power(0.5, age / half_life)
+        decay[self.days == UNKNOWN_DATE] = 0.0
+        return decay
+
+    def recency_order(self):
+        """Doc-id terurut dari yang terbaru, urutan decay menurun (artikel tanpa tanggal tidak termasuk)."""
+        return self.sorted_docs[::-1]
+
+    def bounds(self):
+        """Tanggal terbit paling awal dan paling akhir di corpus.
+
+        Returns:
+            tuple: (date, date), None jika tidak ada artikel bertanggal
+        """
+        if len(self.sorted_days) == 0:
+            return None
+        return from_days(self.sorted_days[0]), from_days(self.sorted_days[-1])
@@ -0,0 +1,134 @@
+import re
+import zlib
+import numpy as np
+
+# Jumlah fungsi hash MinHash dan pembagiannya menjadi band LSH
+NUM_PERM = 128
+LSH_BANDS = 16
+
+# Panjang shingle dalam kata
+SHINGLE_SIZE = 5
+
+# Estimasi Jaccard minimal agar dua artikel dianggap near-duplicate
+DUPLICATE_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Memecah teks menjadi himpunan shingle (n-gram kata).
+
+    Args:
+        text (str): Teks artikel
+        size (int): Jumlah kata per shingle
+
+    Returns:
+        set: Himpunan shingle, kosong jika teks tidak memuat kata
+    """
+    words = re.findall(r'[a-z0-9]+', text.lower())
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+class DuplicateIndex:
+    """Index near-duplicate berbasis MinHash dan LSH banding.
+
+    Signature MinHash dibagi menjadi beberapa band; dua artikel menjadi
+    kandidat jika minimal satu band-nya identik, sehingga pengecekan artikel
+    baru tidak perlu membandingkan seluruh corpus. Kandidat lalu diverifikasi
+    dengan estimasi Jaccard dari signature.
+    """
+
+    def __init__(self, threshold=DUPLICATE_THRESHOLD, num_perm=NUM_PERM, bands=LSH_BANDS, seed=1):
+        """
+        Args:
+            threshold (float): Estimasi Jaccard minimal untuk near-duplicate
+            num_perm (int): Jumlah fungsi hash MinHash
+            bands (int): Jumlah band LSH (num_perm harus habis dibagi bands)
+            seed (int): Seed untuk parameter fungsi hash
+        """
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self.b = rng.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = []
+
+    def signature(self, text):
+        """Menghitung signature MinHash sebuah teks.
+
+        Returns:
+            np.ndarray: Signature uint32, None jika teks tidak memiliki shingle
+        """
+        hashes = np.array([zlib.crc32(s.encode('utf-8')) for s in shingles(text)], dtype=np.uint64)
+        if len(hashes) == 0:
+            return None
+        # Hash universal (a * x + b) mod p; overflow uint64 disengaja seperti implementasi MinHash umumnya
+        with np.errstate(over='ignore'):
+            permuted = (np.outer(hashes, self.a) + self.b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def query(self, signature):
+        """Mencari artikel ter-index yang merupakan near-duplicate dari sebuah signature.
+
+        Returns:
+            list: Id artikel near-duplicate terurut menaik
+        """
+        if signature is None:
+            return []
+        candidates = set()
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(key, ()))
+        return [c for c in sorted(candidates)
+                if np.mean(self.signatures[c] == signature) >= self.threshold]
+
+    def insert(self, signature):
+        """Menambahkan signature ke index.
+
+        Returns:
+            int: Id artikel (urutan penambahan)
+        """
+        doc_id = len(self.signatures)
+        self.signatures.append(signature)
+        if signature is not None:
+            for bucket, key in zip(self.buckets, self._band_keys(signature)):
+                bucket.setdefault(key, []).append(doc_id)
+        return doc_id
+
+    def add(self, text):
+        """Menghitung signature teks lalu menambahkannya ke index."""
+        return self.insert(self.signature(text))
+
+def cluster_duplicates(texts, threshold=DUPLICATE_THRESHOLD):
+    """Mengelompokkan artikel near-duplicate.
+
+    Args:
+        texts (list): Teks setiap artikel
+        threshold (float): Estimasi Jaccard minimal untuk near-duplicate
+
+    Returns:
+        np.ndarray: Id cluster per artikel, yaitu indeks artikel pertama di cluster tersebut
+    """
+    index = DuplicateIndex(threshold)
+    parent = np.arange(len(texts))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, text in enumerate(texts):
+        signature = index.signature(text)
+        for j in index.query(signature):
+            # Gabungkan ke root terkecil agar id cluster adalah artikel paling awal
+            root_i, root_j = find(i), find(j)
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+        index.insert(signature)
+
+    return np.array([find(i) for i in range(len(texts))], dtype=np.int32)
@@ -1,17 +1,49 @@
 import json
 import pickle
 import os
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from rank_bm25 import BM25Okapi
-from preprocess import clean_text
+from preprocess import clean_text, stem_cache, load_stem_cache
+from tfidf import TfidfQueryVectorizer, DocumentMatrix
+from postings import CompressedIndex, ImpactIndex
+from semantic import LSAIndex
+from dates import DateIndex
+from popularity import PopularityStore, SCRAPED
+from dedup import cluster_duplicates
+import threading
+from collections import Counter
 import sys
 import re
+import heapq
 import numpy as np
 
 # File untuk menyimpan model TF-IDF dan data terkait
 MODEL_FILE = "tfidf_model.pkl"
 
+# Simpan impact BM25 terkuantisasi 8 bit (lebih hemat, skor sedikit dibulatkan)
+QUANTIZE_IMPACTS = False
+
+# Bangun posting list terurut impact agar pencarian top-k dapat berhenti lebih awal
+IMPACT_ORDERED = True
+
+# Jumlah hasil yang dikembalikan setiap metode pencarian
+TOP_K = 5
+
+# Jumlah halaman hasil yang dihitung sekaligus oleh SearchCursor
+CURSOR_PREFETCH_PAGES = 4
+
+# Pencarian semantik laten (LSA) dengan index approximate nearest neighbour
+LSA_ENABLED = True
+LSA_COMPONENTS = 100
+LSA_NPROBE = 8
+
+# File vektor dokumen LSA (float32, dibaca melalui memory map)
+LSA_VECTORS_FILE = "lsa_vectors.npy"
+
+# File matriks TF-IDF dokumen, hanya dimuat (dengan SciPy) jika dibutuhkan
+TFIDF_MATRIX_FILE = "tfidf_matrix.npz"
+
+# File counter popularitas yang diperbarui online (klik dan scrape ulang jumlah akses)
+POPULARITY_FILE = "popularity.bin"
+
 def extract_access_count(tanggal):
     """Mengekstrak jumlah akses dari string tanggal.
     
@@ -36,16 +68,179 @@ titles = None
 access_counts = None
 vectorizer = None
 X = None
+document_matrix = None
 corpus = None
-bm25 = None
-tokenized_corpus = None
+index = None
+impact_index = None
+lsa_index = None
+date_index = None
+duplicate_clusters = None
+popularity_store = None
+live_access_counts = None
+max_access = None
+normalized_access = None
+access_order = None
+popularity_lock = threading.Lock()
+
+def update_popularity():
+    """Menghitung ulang jumlah akses ternormalisasi dan urutan popularitas dokumen."""
+    global live_access_counts, max_access, normalized_access, access_order
+    
+    counts = popularity_store.total() if popularity_store is not None else access_counts
+    counts = np.array(counts, dtype=np.int64)
+    maximum = counts.max() if len(counts) and counts.max() > 0 else 1
+    normalized = counts / maximum
+    # Urutan stabil agar dokumen dengan akses sama tetap terurut menurut indeks
+    order = np.argsort(-normalized, kind='stable')
+    with popularity_lock:
+        live_access_counts, max_access, normalized_access, access_order = counts, maximum, normalized, order
+
+def popularity_snapshot():
+    """Mengambil popularitas ternormalisasi dan urutannya yang saling konsisten.
+    
+    Kedua array diganti bersamaan di bawah popularity_lock setiap ada
+    perubahan, sehingga pencarian yang berjalan bersamaan (misal sesi
+    Streamlit lain) tidak melihat nilai dan urutan dari versi yang berbeda.
+    
+    Returns:
+        tuple: (popularitas ternormalisasi, doc-id terurut menurut popularitas)
+    """
+    with popularity_lock:
+        return normalized_access, access_order
+
+def _refresh_popularity(doc_id, total):
+    """Memperbarui popularitas satu dokumen tanpa menghitung ulang seluruh urutan.
+    
+    Harus dipanggil dengan popularity_lock. Array lama tidak diubah karena
+    mungkin sedang dipakai pencarian lain; array baru dibuat lalu seluruh
+    global diganti sekaligus.
+    """
+    global live_access_counts, max_access, normalized_access, access_order
+    
+    counts = live_access_counts.copy()
+    old = counts[doc_id]
+    counts[doc_id] = total
+    
+    maximum = max_access
+    if total > max_access or (old == max_access and total < old):
+        # Nilai maksimum berubah sehingga semua nilai ternormalisasi ikut berubah,
+        # tetapi urutan dokumen lain tetap sama
+        maximum = counts.max() if counts.max() > 0 else 1
+        normalized = counts / maximum
+    else:
+        normalized = normalized_access.copy()
+        normalized[doc_id] = total / maximum
+    
+    # Pindahkan dokumen ke posisi barunya dengan binary search pada urutan popularitas
+    order = access_order[access_order != doc_id]
+    key = (-normalized[doc_id], doc_id)
+    lo, hi = 0, len(order)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (-normalized[order[mid]], order[mid]) < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    live_access_counts, max_access, normalized_access, access_order = (
+        counts, maximum, normalized, np.insert(order, lo, doc_id))
+
+def record_access(doc_id, amount=1):
+    """Mencatat akses (klik) sebuah artikel dan memperbarui popularitas secara online.
+    
+    Args:
+        doc_id (int): Indeks artikel
+        amount (int): Jumlah akses yang ditambahkan
+        
+    Returns:
+        int: Jumlah akses artikel setelah diperbarui
+    """
+    with popularity_lock:
+        total = popularity_store.increment(doc_id, amount)
+        _refresh_popularity(doc_id, total)
+        popularity_store.flush()
+    return total
+
+def set_access_count(doc_id, count):
+    """Mengganti jumlah akses hasil scrape sebuah artikel tanpa membangun ulang model.
+    
+    Args:
+        doc_id (int): Indeks artikel
+        count (int): Jumlah akses terbaru dari website
+        
+    Returns:
+        int: Jumlah akses artikel (termasuk klik) setelah diperbarui
+    """
+    with popularity_lock:
+        total = popularity_store.set_scraped(doc_id, count)
+        _refresh_popularity(doc_id, total)
+    return total
+
+def refresh_access_counts():
+    """Mengambil ulang jumlah akses setiap artikel dari website dan memperbarui popularitas."""
+    from scraper import scrape_articles
+    
+    updated = 0
+    for i, (url, detail, error) in enumerate(scrape_articles([a['url'] for a in articles])):
+        if error is not None:
+            print(f"Gagal memperbarui jumlah akses {url}: {str(error)}", file=sys.stderr)
+            continue
+        count = extract_access_count(detail['tanggal'])
+        if count != popularity_store.counts[i, SCRAPED]:
+            set_access_count(i, count)
+            updated += 1
+    popularity_store.flush()
+    print(f"Jumlah akses diperbarui untuk {updated} artikel", file=sys.stderr)
+    return updated
+
+def tfidf_matrix():
+    """Matriks TF-IDF dokumen x term, dimuat dari file saat pertama kali dibutuhkan.
+    
+    Pencarian dengan posting list terurut impact dan LSA tidak memerlukan
+    matriks ini, sehingga SciPy tidak perlu diimpor saat memuat model.
+    """
+    global X
+    if X is None:
+        from scipy.sparse import load_npz
+        X = load_npz(TFIDF_MATRIX_FILE)
+    return X
+
+def tfidf_rows():
+    """Baris matriks TF-IDF untuk random access skor dokumen saat pencarian top-k.
+    
+    Dibaca langsung dari file matriks tanpa SciPy, kecuali matriks sudah ada di memori.
+    """
+    global document_matrix
+    if document_matrix is None:
+        document_matrix = DocumentMatrix.from_sparse(X) if X is not None else DocumentMatrix.load(TFIDF_MATRIX_FILE)
+    return document_matrix
+
+def build_impact_index():
+    """Membangun posting list terurut impact untuk TF-IDF dan BM25."""
+    print("Membangun posting list terurut impact...", file=sys.stderr)
+    return {
+        'tfidf': ImpactIndex.from_matrix(tfidf_matrix()),
+        'bm25': ImpactIndex.from_compressed(index)
+    }
+
+def build_duplicate_clusters():
+    """Mengelompokkan artikel near-duplicate dengan MinHash/LSH."""
+    print("Mendeteksi artikel near-duplicate...", file=sys.stderr)
+    clusters = cluster_duplicates([a['konten'] for a in articles])
+    print(f"{len(articles)} artikel membentuk {len(np.unique(clusters))} cluster", file=sys.stderr)
+    return clusters
+
+def build_lsa_index():
+    """Membangun index LSA dari matriks TF-IDF."""
+    print("Membangun index LSA...", file=sys.stderr)
+    return LSAIndex(tfidf_matrix(), LSA_VECTORS_FILE, n_components=LSA_COMPONENTS, nprobe=LSA_NPROBE)
 
 def initialize_model():
-    """Inisialisasi model TF-IDF, BM25 dan data terkait.
+    """Inisialisasi model TF-IDF, BM25, LSA dan data terkait.
     Jika file model sudah ada, muat dari file tersebut.
     Jika tidak, buat model baru dan simpan ke file.
     """
-    global articles, titles, access_counts, vectorizer, X, corpus, bm25, tokenized_corpus
+    global articles, titles, access_counts, vectorizer, X, corpus, index, impact_index, lsa_index, date_index
+    global popularity_store, duplicate_clusters, document_matrix
     
     try:
         # Cek apakah file model sudah ada
@@ -59,21 +254,62 @@ def initialize_model():
                     titles = data['titles']
                     access_counts = data['access_counts']
                     vectorizer = data['vectorizer']
-                    X = data['X']
-                    corpus = data['corpus']
-                    bm25 = data.get('bm25', None)
-                    tokenized_corpus = data.get('tokenized_corpus', None)
+                    # Model lama menyimpan matriks TF-IDF di dalam file model
+                    X = data.get('X', None)
+                    index = data.get('index', None)
+                    impact_index = data.get('impact_index', None)
+                    lsa_index = data.get('lsa_index', None)
+                    date_index = data.get('date_index', None)
+                    duplicate_clusters = data.get('duplicate_clusters', None)
+                    load_stem_cache(data.get('stem_cache', {}))
+                
+                if X is None and not os.path.exists(TFIDF_MATRIX_FILE):
+                    raise FileNotFoundError(f"{TFIDF_MATRIX_FILE} tidak ditemukan")
                 
                 print(f"Model berhasil dimuat. {len(articles)} artikel tersedia.", file=sys.stderr)
-                print(f"Vocabulary size: {len(vectorizer.vocabulary_)}", file=sys.stderr)
+                popularity_store = PopularityStore.open(POPULARITY_FILE, access_counts, [a['url'] for a in articles])
+                update_popularity()
+                
+                # Lengkapi komponen yang belum ada di file model lalu simpan ulang
+                updated = 'X' in data
+                
+                # Model lama menyimpan TfidfVectorizer scikit-learn, cukup simpan vocabulary dan idf
+                if not isinstance(vectorizer, TfidfQueryVectorizer):
+                    vectorizer = TfidfQueryVectorizer.from_sklearn(vectorizer)
+                    updated = True
+                print(f"Vocabulary size: {len(vectorizer.vocabulary)}", file=sys.stderr)
                 
-                # Jika BM25 tidak ada dalam file lama, inisialisasi ulang
-                if bm25 is None or tokenized_corpus is None:
-                    print("Menginisialisasi BM25 untuk model lama...", file=sys.stderr)
-                    tokenized_corpus = [doc.split() for doc in corpus]
-                    bm25 = BM25Okapi(tokenized_corpus)
-                    print(f"BM25 model initialized with {len(tokenized_corpus)} documents", file=sys.stderr)
-                    # Simpan ulang model dengan BM25
+                # Model lama menyimpan corpus dan objek BM25Okapi, ubah ke index terkompresi
+                if index is None:
+                    print("Mengompresi index BM25 untuk model lama...", file=sys.stderr)
+                    corpus = data['corpus']
+                    X = tfidf_matrix().astype(np.float32)
+                    document_matrix = None
+                    index = CompressedIndex([doc.split() for doc in corpus], quantize=QUANTIZE_IMPACTS)
+                    print(f"BM25 index built with {index.num_docs} documents", file=sys.stderr)
+                    updated = True
+                
+                # Format lama menyimpan posting list impact tanpa kompresi, bangun ulang
+                if impact_index is not None and not hasattr(impact_index['tfidf'], 'doc_bytes'):
+                    impact_index = None
+                
+                if IMPACT_ORDERED and impact_index is None:
+                    impact_index = build_impact_index()
+                    updated = True
+                
+                if date_index is None:
+                    date_index = DateIndex.from_articles(articles)
+                    updated = True
+                
+                if duplicate_clusters is None:
+                    duplicate_clusters = build_duplicate_clusters()
+                    updated = True
+                
+                if LSA_ENABLED and (lsa_index is None or not os.path.exists(lsa_index.vectors_file)):
+                    lsa_index = build_lsa_index()
+                    updated = True
+                
+                if updated:
                     save_model()
                 
                 return True
@@ -107,19 +343,33 @@ def initialize_model():
         # Mengekstrak judul dan jumlah akses
         titles = [a['judul'] for a in articles]
         access_counts = [extract_access_count(a.get('tanggal', '0 kali')) for a in articles]
+        # Jumlah klik dari counter lama dibawa ke model baru berdasarkan URL artikel
+        popularity_store = PopularityStore.rebuild(POPULARITY_FILE, access_counts, [a['url'] for a in articles])
+        update_popularity()
+        
+        # Parsing tanggal terbit menjadi kolom integer dengan index terurut
+        date_index = DateIndex.from_articles(articles)
+        
+        # Kelompokkan artikel near-duplicate agar dapat diringkas di hasil pencarian
+        duplicate_clusters = build_duplicate_clusters()
         
         # Menghitung skor TF-IDF
-        vectorizer = TfidfVectorizer(min_df=1, stop_words=None)
-        X = vectorizer.fit_transform(corpus)
+        # float32 sudah cukup presisi untuk cosine similarity dan setengah ukuran float64
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        tfidf_vectorizer = TfidfVectorizer(min_df=1, stop_words=None, dtype=np.float32)
+        X = tfidf_vectorizer.fit_transform(corpus)
+        document_matrix = None
+        vectorizer = TfidfQueryVectorizer.from_sklearn(tfidf_vectorizer)
         
-        # Inisialisasi BM25
+        # Inisialisasi BM25 dengan posting list terkompresi
         print("Menginisialisasi BM25...", file=sys.stderr)
-        tokenized_corpus = [doc.split() for doc in corpus]
-        bm25 = BM25Okapi(tokenized_corpus)
+        index = CompressedIndex([doc.split() for doc in corpus], quantize=QUANTIZE_IMPACTS)
         
-        print(f"Vocabulary size: {len(vectorizer.vocabulary_)}", file=sys.stderr)
-        print(f"Feature names: {list(vectorizer.vocabulary_.keys())[:10]}", file=sys.stderr)
-        print(f"BM25 model initialized with {len(tokenized_corpus)} documents", file=sys.stderr)
+        print(f"Vocabulary size: {len(vectorizer.vocabulary)}", file=sys.stderr)
+        print(f"Feature names: {list(vectorizer.vocabulary.keys())[:10]}", file=sys.stderr)
+        print(f"BM25 index built with {index.num_docs} documents ({index.nbytes()} bytes)", file=sys.stderr)
+        impact_index = build_impact_index() if IMPACT_ORDERED else None
+        lsa_index = build_lsa_index() if LSA_ENABLED else None
         
         # Simpan model ke file
         save_model()
@@ -130,113 +380,355 @@ def initialize_model():
         raise
 
 def save_model():
-    """Menyimpan model TF-IDF, BM25 dan data terkait ke file."""
+    """Menyimpan model TF-IDF, BM25 dan data terkait ke file.
+    
+    Corpus hasil preprocessing tidak ikut disimpan karena seluruh informasi
+    yang dibutuhkan BM25 sudah ada di index terkompresi. Matriks TF-IDF
+    disimpan terpisah di TFIDF_MATRIX_FILE agar file model dapat dimuat tanpa
+    scikit-learn dan SciPy.
+    """
     try:
         print("Menyimpan model TF-IDF dan BM25 ke file...", file=sys.stderr)
+        if X is not None:
+            from scipy.sparse import save_npz
+            save_npz(TFIDF_MATRIX_FILE, X, compressed=False)
         data = {
             'articles': articles,
             'titles': titles,
             'access_counts': access_counts,
             'vectorizer': vectorizer,
-            'X': X,
-            'corpus': corpus,
-            'bm25': bm25,
-            'tokenized_corpus': tokenized_corpus
+            'stem_cache': stem_cache,
+            'index': index,
+            'impact_index': impact_index,
+            'lsa_index': lsa_index,
+            'date_index': date_index,
+            'duplicate_clusters': duplicate_clusters
         }
         with open(MODEL_FILE, 'wb') as f:
-            pickle.dump(data, f)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(f"Model berhasil disimpan ke {MODEL_FILE}", file=sys.stderr)
         return True
     except Exception as e:
         print(f"Error saat menyimpan model: {str(e)}", file=sys.stderr)
         return False
 
-def search_tfidf(query, alpha=0.7):
-    """Mencari artikel menggunakan TF-IDF dengan mempertimbangkan similarity dan frekuensi akses.
+def publish_date_range():
+    """Rentang tanggal terbit artikel di model, untuk batas filter tanggal.
+    
+    Returns:
+        tuple: (tanggal paling awal, tanggal paling akhir), None jika model belum dimuat
+    """
+    return date_index.bounds() if date_index is not None else None
+
+def date_constraints(date_from=None, date_to=None, half_life=None):
+    """Membuat bitset filter tanggal dan faktor recency decay.
     
     Args:
-        query (str): Query pencarian
+        date_from (date | str): Tanggal terbit paling awal
+        date_to (date | str): Tanggal terbit paling akhir
+        half_life (float): Umur artikel (hari) saat skornya tinggal setengah
+        
+    Returns:
+        tuple: (bitset dokumen, faktor decay), None jika tidak digunakan
+    """
+    mask = date_index.range_mask(date_from, date_to) if date_from or date_to else None
+    decay = date_index.recency_decay(half_life) if half_life else None
+    return mask, decay
+
+def rank_tfidf(cleaned_query, alpha=0.7, k=TOP_K, date_from=None, date_to=None, half_life=None):
+    """Menghitung k dokumen teratas TF-IDF untuk query yang sudah dipreprocess.
+    
+    Args:
+        cleaned_query (str): Query hasil clean_text
         alpha (float): Bobot untuk similarity score (1-alpha untuk skor frekuensi akses)
+        k (int): Jumlah dokumen teratas
+        date_from (date | str): Tanggal terbit paling awal
+        date_to (date | str): Tanggal terbit paling akhir
+        half_life (float): Half-life recency decay dalam hari, None untuk menonaktifkan
         
     Returns:
-        list: Daftar artikel terurut berdasarkan kombinasi similarity dan frekuensi akses
+        tuple: (indeks dokumen, similarity score, skor kombinasi) terurut menurun
     """
-    cleaned_query = clean_text(query)
+    mask, decay = date_constraints(date_from, date_to, half_life)
+    popularity, popularity_order = popularity_snapshot()
     
     # Menghitung similarity score
-    query_vec = vectorizer.transform([cleaned_query])
-    similarity = cosine_similarity(query_vec, X).flatten()
+    query_vec = vectorizer.transform(cleaned_query)
+    
+    if impact_index is not None:
+        # Vektor query dan baris X sudah ternormalisasi L2, cosine = dot product
+        weights = dict(zip(query_vec.indices, query_vec.data))
+        rows = tfidf_rows()
+        return impact_index['tfidf'].top_k(weights, k, lambda docs: rows.dot(docs, query_vec), alpha,
+                                           popularity, popularity_order, mask=mask, decay=decay,
+                                           decay_order=date_index.recency_order())
     
-    # Normalisasi skor frekuensi akses
-    max_access = max(access_counts) if access_counts else 1
-    normalized_access = [count/max_access for count in access_counts]
+    # Baris X sudah ternormalisasi L2 sehingga cosine similarity = dot product
+    similarity = tfidf_matrix()[:, query_vec.indices] @ query_vec.data
     
     # Menghitung skor kombinasi
-    combined_scores = [alpha * sim + (1-alpha) * acc 
-                      for sim, acc in zip(similarity, normalized_access)]
+    combined_scores = alpha * similarity + (1-alpha) * popularity
+    if decay is not None:
+        combined_scores = combined_scores * decay
     
-    # Mendapatkan indeks artikel teratas
-    top_indices = sorted(range(len(combined_scores)), 
-                        key=lambda i: combined_scores[i], 
-                        reverse=True)[:5]
+    # Mendapatkan indeks artikel teratas dengan heap
+    candidates = range(len(combined_scores)) if mask is None else np.flatnonzero(mask)
+    top_indices = heapq.nlargest(k, candidates, key=combined_scores.__getitem__)
+    return top_indices, similarity[top_indices], combined_scores[top_indices]
+
+def rank_bm25(cleaned_query, alpha=0.7, k=TOP_K, date_from=None, date_to=None, half_life=None):
+    """Menghitung k dokumen teratas BM25 untuk query yang sudah dipreprocess.
+    
+    Args:
+        cleaned_query (str): Query hasil clean_text
+        alpha (float): Bobot untuk BM25 score (1-alpha untuk skor frekuensi akses)
+        k (int): Jumlah dokumen teratas
+        date_from (date | str): Tanggal terbit paling awal
+        date_to (date | str): Tanggal terbit paling akhir
+        half_life (float): Half-life recency decay dalam hari, None untuk menonaktifkan
+        
+    Returns:
+        tuple: (indeks dokumen, BM25 score, skor kombinasi) terurut menurun
+    """
+    mask, decay = date_constraints(date_from, date_to, half_life)
+    popularity, popularity_order = popularity_snapshot()
+    tokenized_query = cleaned_query.split()
+    
+    if impact_index is not None:
+        weights = Counter(index.vocabulary[t] for t in tokenized_query if t in index.vocabulary)
+        # Skor BM25 dinormalisasi dengan skor maksimum yang dicari pada penelusuran yang sama
+        return impact_index['bm25'].top_k(weights, k, index.scorer(weights), alpha, popularity,
+                                          popularity_order, norm=None, mask=mask, decay=decay,
+                                          decay_order=date_index.recency_order())
+    
+    # Menghitung BM25 scores
+    bm25_scores = index.bm25_scores(tokenized_query)
+    
+    # Normalisasi BM25 scores terhadap dokumen yang lolos filter
+    allowed = bm25_scores if mask is None else bm25_scores[mask]
+    max_bm25 = allowed.max() if len(allowed) and allowed.max() > 0 else 1
+    normalized_bm25 = bm25_scores / max_bm25
+    
+    # Menghitung skor kombinasi
+    combined_scores = alpha * normalized_bm25 + (1-alpha) * popularity
+    if decay is not None:
+        combined_scores = combined_scores * decay
+    
+    # Mendapatkan indeks artikel teratas dengan heap
+    candidates = range(len(combined_scores)) if mask is None else np.flatnonzero(mask)
+    top_indices = heapq.nlargest(k, candidates, key=combined_scores.__getitem__)
+    return top_indices, bm25_scores[top_indices], combined_scores[top_indices]
+
+def rank_lsa(cleaned_query, alpha=0.7, k=TOP_K, date_from=None, date_to=None, half_life=None):
+    """Menghitung k dokumen teratas LSA untuk query yang sudah dipreprocess.
+    
+    Args:
+        cleaned_query (str): Query hasil clean_text
+        alpha (float): Bobot untuk similarity semantik (1-alpha untuk skor frekuensi akses)
+        k (int): Jumlah dokumen teratas
+        date_from (date | str): Tanggal terbit paling awal
+        date_to (date | str): Tanggal terbit paling akhir
+        half_life (float): Half-life recency decay dalam hari, None untuk menonaktifkan
+        
+    Returns:
+        tuple: (indeks dokumen, similarity semantik, skor kombinasi) terurut menurun
+    """
+    mask, decay = date_constraints(date_from, date_to, half_life)
+    query_vec = vectorizer.transform(cleaned_query)
+    popularity, popularity_order = popularity_snapshot()
+    return lsa_index.top_k(query_vec, k, alpha, popularity, popularity_order, mask=mask, decay=decay)
+
+RANKERS = {
+    'tfidf': rank_tfidf,
+    'bm25': rank_bm25,
+    'lsa': rank_lsa
+}
+
+def rank(method, cleaned_query, alpha=0.7, k=TOP_K, date_from=None, date_to=None, half_life=None,
+         collapse_duplicates=False):
+    """Menghitung k dokumen teratas dengan salah satu metode pada RANKERS.
+    
+    Jika collapse_duplicates aktif, hanya dokumen dengan skor tertinggi dari
+    setiap cluster near-duplicate yang dikembalikan. Ranker diminta hasil
+    lebih banyak (berlipat dua) sampai k cluster berbeda terkumpul.
+    
+    Returns:
+        tuple: (indeks dokumen, skor metode, skor kombinasi) terurut menurun
+    """
+    ranker = RANKERS[method]
+    if not collapse_duplicates or duplicate_clusters is None:
+        return ranker(cleaned_query, alpha, k, date_from, date_to, half_life)
+    
+    fetch = k
+    while True:
+        doc_ids, scores, combined_scores = ranker(cleaned_query, alpha, fetch, date_from, date_to, half_life)
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        # Posisi pertama setiap cluster pada hasil terurut adalah wakilnya
+        _, first = np.unique(duplicate_clusters[doc_ids], return_index=True)
+        keep = np.sort(first)[:k]
+        if len(keep) >= k or len(doc_ids) < fetch:
+            return doc_ids[keep], np.asarray(scores)[keep], np.asarray(combined_scores)[keep]
+        fetch *= 2
+
+def search_tfidf(query, alpha=0.7, top_k=TOP_K, date_from=None, date_to=None, half_life=None,
+                 collapse_duplicates=False):
+    """Mencari artikel menggunakan TF-IDF dengan mempertimbangkan similarity dan frekuensi akses.
+    
+    Args:
+        query (str): Query pencarian
+        alpha (float): Bobot untuk similarity score (1-alpha untuk skor frekuensi akses)
+        top_k (int): Jumlah artikel yang dikembalikan
+        date_from (date | str): Tanggal terbit paling awal
+        date_to (date | str): Tanggal terbit paling akhir
+        half_life (float): Half-life recency decay dalam hari, None untuk menonaktifkan
+        collapse_duplicates (bool): Tampilkan satu artikel saja dari setiap cluster near-duplicate
+        
+    Returns:
+        list: Daftar artikel terurut berdasarkan kombinasi similarity dan frekuensi akses
+    """
+    top_indices, similarity, combined_scores = rank(
+        'tfidf', clean_text(query), alpha, top_k, date_from, date_to, half_life, collapse_duplicates)
     
     # Mengembalikan hasil pencarian dengan informasi lengkap
     results = [(titles[i], 
              articles[i]['url'], 
-             similarity[i],
-             access_counts[i],
-             combined_scores[i]) for i in top_indices]
+             sim,
+             live_access_counts[i],
+             score) for i, sim, score in zip(top_indices, similarity, combined_scores)]
     
     return results
 
-def search_bm25(query, alpha=0.7):
+def search_bm25(query, alpha=0.7, top_k=TOP_K, date_from=None, date_to=None, half_life=None,
+                collapse_duplicates=False):
     """Mencari artikel menggunakan BM25 dengan mempertimbangkan similarity dan frekuensi akses.
     
     Args:
         query (str): Query pencarian
         alpha (float): Bobot untuk BM25 score (1-alpha untuk skor frekuensi akses)
+        top_k (int): Jumlah artikel yang dikembalikan
+        date_from (date | str): Tanggal terbit paling awal
+        date_to (date | str): Tanggal terbit paling akhir
+        half_life (float): Half-life recency decay dalam hari, None untuk menonaktifkan
+        collapse_duplicates (bool): Tampilkan satu artikel saja dari setiap cluster near-duplicate
         
     Returns:
         list: Daftar artikel terurut berdasarkan kombinasi BM25 score dan frekuensi akses
     """
-    cleaned_query = clean_text(query)
-    tokenized_query = cleaned_query.split()
+    top_indices, bm25_scores, combined_scores = rank(
+        'bm25', clean_text(query), alpha, top_k, date_from, date_to, half_life, collapse_duplicates)
     
-    # Menghitung BM25 scores
-    bm25_scores = bm25.get_scores(tokenized_query)
-    
-    # Normalisasi skor frekuensi akses
-    max_access = max(access_counts) if access_counts else 1
-    normalized_access = [count/max_access for count in access_counts]
-    
-    # Normalisasi BM25 scores
-    max_bm25 = max(bm25_scores) if max(bm25_scores) > 0 else 1
-    normalized_bm25 = [score/max_bm25 for score in bm25_scores]
+    # Mengembalikan hasil pencarian dengan informasi lengkap
+    results = [(titles[i], 
+             articles[i]['url'], 
+             bm25_score,
+             live_access_counts[i],
+             score) for i, bm25_score, score in zip(top_indices, bm25_scores, combined_scores)]
     
-    # Menghitung skor kombinasi
-    combined_scores = [alpha * bm25_score + (1-alpha) * acc 
-                      for bm25_score, acc in zip(normalized_bm25, normalized_access)]
+    return results
+
+def search_lsa(query, alpha=0.7, top_k=TOP_K, date_from=None, date_to=None, half_life=None,
+               collapse_duplicates=False):
+    """Mencari artikel secara semantik (LSA) dengan mempertimbangkan frekuensi akses.
     
-    # Mendapatkan indeks artikel teratas
-    top_indices = sorted(range(len(combined_scores)), 
-                        key=lambda i: combined_scores[i], 
-                        reverse=True)[:5]
+    Args:
+        query (str): Query pencarian
+        alpha (float): Bobot untuk similarity semantik (1-alpha untuk skor frekuensi akses)
+        top_k (int): Jumlah artikel yang dikembalikan
+        date_from (date | str): Tanggal terbit paling awal
+        date_to (date | str): Tanggal terbit paling akhir
+        half_life (float): Half-life recency decay dalam hari, None untuk menonaktifkan
+        collapse_duplicates (bool): Tampilkan satu artikel saja dari setiap cluster near-duplicate
+        
+    Returns:
+        list: Daftar artikel terurut berdasarkan kombinasi similarity semantik dan frekuensi akses
+    """
+    top_indices, similarity, combined_scores = rank(
+        'lsa', clean_text(query), alpha, top_k, date_from, date_to, half_life, collapse_duplicates)
     
     # Mengembalikan hasil pencarian dengan informasi lengkap
     results = [(titles[i], 
              articles[i]['url'], 
-             bm25_scores[i],
-             access_counts[i],
-             combined_scores[i]) for i in top_indices]
+             sim,
+             live_access_counts[i],
+             score) for i, sim, score in zip(top_indices, similarity, combined_scores)]
     
     return results
 
+class SearchCursor:
+    """Cursor paginasi hasil pencarian di sisi server.
+    
+    Top-k untuk beberapa halaman pertama dihitung sekali lalu disimpan,
+    sehingga berpindah halaman tidak menghitung ulang skor. Jika halaman yang
+    diminta melewati cache, jumlah hasil yang diambil digandakan.
+    """
+    
+    def __init__(self, query, method='tfidf', alpha=0.7, page_size=TOP_K, prefetch_pages=CURSOR_PREFETCH_PAGES,
+                 date_from=None, date_to=None, half_life=None, collapse_duplicates=False):
+        """
+        Args:
+            query (str): Query pencarian
+            method (str): Metode pencarian, salah satu kunci RANKERS
+            alpha (float): Bobot untuk skor relevansi (1-alpha untuk skor frekuensi akses)
+            page_size (int): Jumlah hasil per halaman
+            prefetch_pages (int): Jumlah halaman yang dihitung di awal
+            date_from (date | str): Tanggal terbit paling awal
+            date_to (date | str): Tanggal terbit paling akhir
+            half_life (float): Half-life recency decay dalam hari, None untuk menonaktifkan
+            collapse_duplicates (bool): Tampilkan satu artikel saja dari setiap cluster near-duplicate
+        """
+        self.cleaned_query = clean_text(query)
+        self.method = method
+        self.alpha = alpha
+        self.page_size = page_size
+        self.filters = (date_from, date_to, half_life, collapse_duplicates)
+        mask, _ = date_constraints(date_from, date_to)
+        self.total = len(articles) if mask is None else int(mask.sum())
+        if collapse_duplicates and duplicate_clusters is not None:
+            clusters = duplicate_clusters if mask is None else duplicate_clusters[mask]
+            self.total = len(np.unique(clusters))
+        self.doc_ids = []
+        self.scores = []
+        self.combined_scores = []
+        self._fetch(page_size * prefetch_pages)
+    
+    def _fetch(self, k):
+        """Mengisi cache dengan k hasil teratas."""
+        k = min(k, self.total)
+        self.doc_ids, self.scores, self.combined_scores = rank(self.method, self.cleaned_query, self.alpha, k,
+                                                              *self.filters)
+    
+    def num_pages(self):
+        """Jumlah halaman yang tersedia."""
+        return max(1, -(-self.total // self.page_size))
+    
+    def page(self, number):
+        """Mengambil hasil untuk satu halaman.
+        
+        Args:
+            number (int): Nomor halaman, dimulai dari 1
+            
+        Returns:
+            list: Tuple (indeks dokumen, judul, url, skor, jumlah akses, skor kombinasi)
+        """
+        start = (number - 1) * self.page_size
+        end = min(start + self.page_size, self.total)
+        if end > len(self.doc_ids):
+            self._fetch(max(end, 2 * len(self.doc_ids)))
+        
+        return [(int(i), titles[i], articles[i]['url'], self.scores[j], live_access_counts[i], self.combined_scores[j])
+                for j, i in enumerate(self.doc_ids[start:end], start)]
+
 def search(query, alpha=0.7):
-    """Mencari artikel menggunakan kedua metode: TF-IDF dan BM25.
+    """Mencari artikel menggunakan metode TF-IDF, BM25 dan LSA (jika tersedia).
+    
+    Hasil LSA hanya dicetak; gunakan search_lsa untuk mengambilnya.
     
     Args:
         query (str): Query pencarian
         alpha (float): Bobot untuk similarity/BM25 score (1-alpha untuk skor frekuensi akses)
+        
+    Returns:
+        tuple: (hasil TF-IDF, hasil BM25)
     """
     print(f"\nMencari dengan query: '{query}'")
     print(f"Preprocessing query...")
@@ -279,6 +771,22 @@ def search(query, alpha=0.7):
             print(f"Combined Score: {score:.4f}")
             print("-" * 50)
     
+    # Pencarian semantik dengan LSA
+    if lsa_index is not None:
+        print("\n" + "="*60)
+        print("HASIL PENCARIAN MENGGUNAKAN LSA")
+        print("="*60)
+        
+        lsa_results = search_lsa(query, alpha)
+        for i, (title, url, sim, acc, score) in enumerate(lsa_results, 1):
+            print(f"\nHasil #{i}")
+            print(f"Judul: {title}")
+            print(f"URL: {url}")
+            print(f"LSA Similarity Score: {sim:.4f}")
+            print(f"Access Count: {acc}")
+            print(f"Combined Score: {score:.4f}")
+            print("-" * 50)
+    
     return tfidf_results, bm25_results
 
 
@@ -306,13 +814,18 @@ if __name__ == "__main__":
             print("\n===== MENU PENCARIAN =====\n")
             print("1. Gunakan query hardcoded")
             print("2. Masukkan query secara manual")
-            print("3. Keluar")
-            choice = input("Pilih opsi (1/2/3): ")
+            print("3. Perbarui jumlah akses dari website")
+            print("4. Keluar")
+            choice = input("Pilih opsi (1/2/3/4): ")
             
-            if choice == "3":
+            if choice == "4":
                 print("Terima kasih telah menggunakan sistem pencarian!")
                 break
             
+            if choice == "3":
+                refresh_access_counts()
+                continue
+            
             if choice == "1":
                 # Opsi 1: Hardcoded query
                 query = "ekonomi desa"
@@ -0,0 +1,161 @@
+import os
+import json
+import threading
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: hanya penguncian antar-thread
+    fcntl = None
+
+# Kolom counter: jumlah akses hasil scrape dan jumlah klik dari aplikasi
+SCRAPED = 0
+CLICKS = 1
+
+def keys_path(path):
+    """Path file key (URL artikel per baris counter) yang menyertai file counter."""
+    return path + '.keys'
+
+class PopularityStore:
+    """Counter popularitas artikel di file memory-mapped yang dapat diperbarui online.
+
+    Setiap dokumen memiliki dua counter int64: jumlah akses hasil scrape
+    ("N kali") dan jumlah klik dari aplikasi. Popularitas adalah jumlah
+    keduanya. Perubahan dilakukan di bawah lock sehingga aman dipakai beberapa
+    thread dan proses sekaligus, tanpa perlu membangun ulang model.
+    """
+
+    def __init__(self, path, counts):
+        """
+        Args:
+            path (str): Path file counter
+            counts (np.memmap): Array counter berukuran (jumlah dokumen, 2)
+        """
+        self.path = path
+        self.counts = counts
+        self._lock = threading.Lock()
+        self._lock_fd = None
+
+    @classmethod
+    def create(cls, path, scraped_counts, keys=None, clicks=None):
+        """Membuat file counter baru dari jumlah akses hasil scrape.
+
+        Args:
+            path (str): Path file counter
+            scraped_counts (list): Jumlah akses hasil scrape untuk setiap dokumen
+            keys (list): Key setiap dokumen (URL artikel), disimpan untuk rebuild berikutnya
+            clicks (list): Jumlah klik awal setiap dokumen, default 0
+        """
+        counts = np.memmap(path, dtype=np.int64, mode='w+', shape=(len(scraped_counts), 2))
+        counts[:, SCRAPED] = scraped_counts
+        if clicks is not None:
+            counts[:, CLICKS] = clicks
+        counts.flush()
+        if keys is not None:
+            cls._write_keys(path, keys)
+        return cls(path, counts)
+
+    @classmethod
+    def open(cls, path, scraped_counts, keys=None):
+        """Membuka file counter yang ada, atau membuat baru jika ukurannya tidak cocok.
+
+        Args:
+            path (str): Path file counter
+            scraped_counts (list): Jumlah akses hasil scrape untuk setiap dokumen
+            keys (list): Key setiap dokumen (URL artikel)
+
+        Returns:
+            PopularityStore: Store yang siap dipakai
+        """
+        expected = len(scraped_counts) * 2 * np.dtype(np.int64).itemsize
+        if os.path.exists(path) and os.path.getsize(path) == expected:
+            counts = np.memmap(path, dtype=np.int64, mode='r+', shape=(len(scraped_counts), 2))
+            # File counter dari versi sebelumnya belum memiliki file key
+            if keys is not None and not os.path.exists(keys_path(path)):
+                cls._write_keys(path, keys)
+            return cls(path, counts)
+        if keys is not None:
+            return cls.rebuild(path, scraped_counts, keys)
+        return cls.create(path, scraped_counts)
+
+    @classmethod
+    def rebuild(cls, path, scraped_counts, keys):
+        """Membuat file counter untuk corpus baru dengan membawa counter dari file lama.
+
+        Counter dicocokkan berdasarkan key (URL artikel), sehingga urutan dan
+        jumlah artikel boleh berubah. Jumlah akses hasil scrape ulang hanya
+        tersimpan di file counter, sehingga diambil nilai terbesar dari file
+        lama dan scraped_counts (jumlah akses tidak pernah berkurang). Artikel
+        baru mulai dengan 0 klik.
+
+        Args:
+            path (str): Path file counter
+            scraped_counts (list): Jumlah akses hasil scrape untuk setiap dokumen
+            keys (list): Key setiap dokumen (URL artikel)
+
+        Returns:
+            PopularityStore: Store yang siap dipakai
+        """
+        old = {}
+        old_keys = cls._read_keys(path)
+        expected = len(old_keys) * 2 * np.dtype(np.int64).itemsize if old_keys is not None else -1
+        if os.path.exists(path) and os.path.getsize(path) == expected:
+            old_counts = np.fromfile(path, dtype=np.int64).reshape(-1, 2)
+            old = dict(zip(old_keys, old_counts.tolist()))
+        scraped = [max(count, old[key][SCRAPED]) if key in old else count
+                   for key, count in zip(keys, scraped_counts)]
+        clicks = [old[key][CLICKS] if key in old else 0 for key in keys]
+        return cls.create(path, scraped, keys, clicks)
+
+    @staticmethod
+    def _write_keys(path, keys):
+        with open(keys_path(path), 'w', encoding='utf-8') as f:
+            json.dump(list(keys), f)
+
+    @staticmethod
+    def _read_keys(path):
+        try:
+            with open(keys_path(path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _update(self, doc_id, column, func):
+        """Mengubah satu counter di bawah lock antar-thread dan antar-proses."""
+        with self._lock:
+            if fcntl is not None:
+                if self._lock_fd is None:
+                    self._lock_fd = os.open(self.path, os.O_RDWR)
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                self.counts[doc_id, column] = func(int(self.counts[doc_id, column]))
+                return self.total(doc_id)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def increment(self, doc_id, amount=1):
+        """Menambah counter klik sebuah dokumen secara atomik.
+
+        Returns:
+            int: Total popularitas dokumen setelah diperbarui
+        """
+        return self._update(doc_id, CLICKS, lambda value: value + amount)
+
+    def set_scraped(self, doc_id, value):
+        """Mengganti jumlah akses hasil scrape sebuah dokumen.
+
+        Returns:
+            int: Total popularitas dokumen setelah diperbarui
+        """
+        return self._update(doc_id, SCRAPED, lambda _: value)
+
+    def total(self, doc_id=None):
+        """Total popularitas satu dokumen, atau seluruh dokumen jika doc_id None."""
+        if doc_id is None:
+            return self.counts.sum(axis=1)
+        return int(self.counts[doc_id].sum())
+
+    def flush(self):
+        """Menulis perubahan ke disk."""
+        self.counts.flush()
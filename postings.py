@@ -0,0 +1,520 @@
+import numpy as np
+from collections import Counter
+
+# Parameter BM25 disamakan dengan default rank_bm25.BM25Okapi
+BM25_K1 = 1.5
+BM25_B = 0.75
+BM25_EPSILON = 0.25
+
+def vbyte_lengths(values):
+    """Menghitung jumlah byte variable-byte untuk setiap nilai.
+
+    Args:
+        values (np.ndarray): Array bilangan bulat non-negatif
+
+    Returns:
+        np.ndarray: Jumlah byte (minimal 1) untuk setiap nilai
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    lengths = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        lengths += rest > 0
+        rest >>= np.uint64(7)
+    return lengths
+
+def vbyte_encode(values):
+    """Mengompresi array bilangan bulat dengan variable-byte encoding.
+
+    Setiap nilai dipecah menjadi kelompok 7 bit (little-endian). Bit tertinggi
+    menandai byte terakhir dari sebuah nilai.
+
+    Args:
+        values (np.ndarray): Array bilangan bulat non-negatif
+
+    Returns:
+        np.ndarray: Array uint8 hasil encoding
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    lengths = vbyte_lengths(values)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    out = np.zeros(int(ends[-1]) if len(ends) else 0, dtype=np.uint8)
+
+    for k in range(int(lengths.max()) if len(lengths) else 0):
+        mask = lengths > k
+        chunk = (values[mask] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        out[starts[mask] + k] = chunk.astype(np.uint8)
+
+    # Tandai byte terakhir setiap nilai
+    if len(out):
+        out[ends - 1] |= 0x80
+    return out
+
+def vbyte_decode(buf):
+    """Mendekompresi array uint8 hasil vbyte_encode secara tervektorisasi.
+
+    Args:
+        buf (np.ndarray): Array uint8 hasil encoding
+
+    Returns:
+        np.ndarray: Array uint64 nilai asli
+    """
+    buf = np.asarray(buf, dtype=np.uint8)
+    if len(buf) == 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    ends = np.flatnonzero(buf & 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+
+    # Posisi setiap byte di dalam nilainya menentukan besar pergeseran bit
+    positions = np.arange(len(buf)) - np.repeat(starts, ends - starts + 1)
+    parts = (buf & 0x7F).astype(np.uint64) << (np.uint64(7) * positions.astype(np.uint64))
+    return np.add.reduceat(parts, starts)
+
+def lookup_sorted(doc_ids, values, docs):
+    """Mengambil nilai posting untuk sekumpulan dokumen dari posting list terurut doc-id.
+
+    Args:
+        doc_ids (np.ndarray): Doc-id posting list, terurut menaik
+        values (np.ndarray): Nilai setiap posting
+        docs (np.ndarray): Doc-id yang dicari
+
+    Returns:
+        np.ndarray: Nilai posting, 0 untuk dokumen yang tidak memuat term
+    """
+    if len(doc_ids) == 0:
+        return np.zeros(len(docs))
+    positions = np.minimum(np.searchsorted(doc_ids, docs), len(doc_ids) - 1)
+    return np.where(doc_ids[positions] == docs, values[positions], 0.0)
+
+class CompressedIndex:
+    """Inverted index dengan posting list terkompresi.
+
+    Doc-id disimpan sebagai selisih (delta) antar dokumen berurutan, lalu
+    dikompresi dengan variable-byte bersama term frequency. Skor impact BM25
+    dapat dikuantisasi ke 8 bit untuk pencarian yang lebih hemat.
+    """
+
+    def __init__(self, tokenized_docs, quantize=False, k1=BM25_K1, b=BM25_B, epsilon=BM25_EPSILON):
+        """Membangun index dari dokumen yang sudah ditokenisasi.
+
+        Args:
+            tokenized_docs (list): Daftar dokumen, masing-masing berupa list token
+            quantize (bool): Simpan impact BM25 terkuantisasi 8 bit
+            k1 (float): Parameter saturasi term frequency BM25
+            b (float): Parameter normalisasi panjang dokumen BM25
+            epsilon (float): Faktor idf minimum untuk term yang sangat umum
+        """
+        self.k1 = k1
+        self.b = b
+        self.num_docs = len(tokenized_docs)
+        self.doc_len = np.array([len(doc) for doc in tokenized_docs], dtype=np.uint32)
+        self.avgdl = float(self.doc_len.sum()) / self.num_docs if self.num_docs else 0.0
+
+        # Kumpulkan pasangan (term, dokumen, frekuensi)
+        vocabulary = {}
+        term_ids, doc_ids, tfs = [], [], []
+        for doc_id, doc in enumerate(tokenized_docs):
+            for term, tf in Counter(doc).items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                doc_ids.append(doc_id)
+                tfs.append(tf)
+        self.vocabulary = vocabulary
+
+        term_ids = np.array(term_ids, dtype=np.int64)
+        doc_ids = np.array(doc_ids, dtype=np.int64)
+        tfs = np.array(tfs, dtype=np.int64)
+
+        # Urutkan posting berdasarkan term lalu doc-id
+        order = np.lexsort((doc_ids, term_ids))
+        term_ids, doc_ids, tfs = term_ids[order], doc_ids[order], tfs[order]
+
+        self.doc_freq = np.bincount(term_ids, minlength=len(vocabulary)).astype(np.uint32)
+        self.posting_offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(self.doc_freq, out=self.posting_offsets[1:])
+
+        # Doc-id pertama tiap term disimpan utuh, sisanya sebagai selisih
+        term_starts = self.posting_offsets[:-1]
+        gaps = np.diff(doc_ids, prepend=0)
+        gaps[term_starts] = doc_ids[term_starts]
+
+        self.doc_bytes = vbyte_encode(gaps)
+        self.doc_byte_offsets = self._byte_offsets(vbyte_lengths(gaps))
+        self.tf_bytes = vbyte_encode(tfs)
+        self.tf_byte_offsets = self._byte_offsets(vbyte_lengths(tfs))
+
+        self.idf = self._compute_idf(epsilon)
+
+        self.impacts = None
+        self.impact_scales = None
+        if quantize:
+            self._quantize_impacts(doc_ids, tfs)
+
+    def _byte_offsets(self, lengths):
+        """Menghitung offset byte awal setiap term dari panjang byte per posting."""
+        byte_ends = np.concatenate(([0], np.cumsum(lengths)))
+        return byte_ends[self.posting_offsets]
+
+    def _compute_idf(self, epsilon):
+        """Menghitung idf BM25 Okapi, term yang terlalu umum diberi nilai epsilon."""
+        df = self.doc_freq.astype(np.float64)
+        idf = np.log(self.num_docs - df + 0.5) - np.log(df + 0.5)
+        if len(idf):
+            idf[idf < 0] = epsilon * idf.mean()
+        return idf
+
+    def _term_impacts(self, term_id, doc_ids, tfs):
+        """Menghitung kontribusi skor BM25 sebuah term untuk setiap posting."""
+        tfs = tfs.astype(np.float64)
+        norm = self.k1 * (1 - self.b + self.b * self.doc_len[doc_ids] / self.avgdl)
+        return self.idf[term_id] * (tfs * (self.k1 + 1) / (tfs + norm))
+
+    def _quantize_impacts(self, doc_ids, tfs):
+        """Menyimpan impact BM25 setiap posting sebagai uint8 dengan skala per term."""
+        self.impacts = np.zeros(len(doc_ids), dtype=np.uint8)
+        self.impact_scales = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term_id in range(len(self.vocabulary)):
+            start, end = self.posting_offsets[term_id], self.posting_offsets[term_id + 1]
+            impacts = self._term_impacts(term_id, doc_ids[start:end], tfs[start:end])
+            # Semua impact satu term memiliki tanda yang sama karena idf-nya sama
+            scale = impacts[np.argmax(np.abs(impacts))] / 255.0
+            if scale != 0:
+                self.impacts[start:end] = np.round(impacts / scale).astype(np.uint8)
+            self.impact_scales[term_id] = scale
+
+    def postings(self, term):
+        """Mendekompresi posting list sebuah term.
+
+        Args:
+            term (str): Term yang dicari
+
+        Returns:
+            tuple: (doc_ids, tfs) sebagai np.ndarray, kosong jika term tidak ada
+        """
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return self._decode(term_id)
+
+    def _decode(self, term_id):
+        doc_start, doc_end = self.doc_byte_offsets[term_id], self.doc_byte_offsets[term_id + 1]
+        tf_start, tf_end = self.tf_byte_offsets[term_id], self.tf_byte_offsets[term_id + 1]
+        doc_ids = np.cumsum(vbyte_decode(self.doc_bytes[doc_start:doc_end])).astype(np.int64)
+        tfs = vbyte_decode(self.tf_bytes[tf_start:tf_end]).astype(np.int64)
+        return doc_ids, tfs
+
+    def term_scores(self, term_id, use_impacts=None):
+        """Mendekompresi posting list sebuah term beserta kontribusi skor BM25-nya.
+
+        Args:
+            term_id (int): Term-id
+            use_impacts (bool): Gunakan impact 8 bit; default mengikuti index
+
+        Returns:
+            tuple: (doc_ids terurut, skor BM25 term) sebagai np.ndarray
+        """
+        if use_impacts is None:
+            use_impacts = self.impacts is not None
+        doc_ids, tfs = self._decode(term_id)
+        if use_impacts:
+            start, end = self.posting_offsets[term_id], self.posting_offsets[term_id + 1]
+            return doc_ids, self.impacts[start:end] * float(self.impact_scales[term_id])
+        return doc_ids, self._term_impacts(term_id, doc_ids, tfs)
+
+    def scorer(self, query_weights, use_impacts=None):
+        """Membuat fungsi random access skor BM25 untuk sekumpulan dokumen.
+
+        Args:
+            query_weights (dict): Bobot query (jumlah kemunculan) per term-id
+            use_impacts (bool): Gunakan impact 8 bit; default mengikuti index
+
+        Returns:
+            callable: Fungsi yang menerima array doc-id dan mengembalikan skor BM25-nya
+        """
+        postings = [(weight, *self.term_scores(term_id, use_impacts))
+                    for term_id, weight in query_weights.items()]
+
+        def score_docs(docs):
+            scores = np.zeros(len(docs))
+            for weight, doc_ids, term_scores in postings:
+                scores += weight * lookup_sorted(doc_ids, term_scores, docs)
+            return scores
+        return score_docs
+
+    def bm25_scores(self, tokenized_query, use_impacts=None):
+        """Menghitung skor BM25 seluruh dokumen untuk sebuah query.
+
+        Hasilnya identik dengan BM25Okapi.get_scores kecuali bila impact
+        terkuantisasi digunakan.
+
+        Args:
+            tokenized_query (list): Daftar token query
+            use_impacts (bool): Gunakan impact 8 bit; default mengikuti index
+
+        Returns:
+            np.ndarray: Skor BM25 untuk setiap dokumen
+        """
+        scores = np.zeros(self.num_docs)
+        for term in tokenized_query:
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            doc_ids, term_scores = self.term_scores(term_id, use_impacts)
+            scores[doc_ids] += term_scores
+        return scores
+
+    def nbytes(self):
+        """Menghitung ukuran total array index dalam byte."""
+        arrays = [self.doc_len, self.doc_freq, self.posting_offsets, self.doc_bytes,
+                  self.doc_byte_offsets, self.tf_bytes, self.tf_byte_offsets, self.idf]
+        if self.impacts is not None:
+            arrays += [self.impacts, self.impact_scales]
+        return sum(a.nbytes for a in arrays)
+
+# Jumlah posting yang dibaca dari setiap list pada satu putaran threshold algorithm
+IMPACT_BLOCK_SIZE = 64
+
+def top_unscored(excluded, k, pop_weight, popularity, popularity_order, mask=None, decay=None):
+    """Mengambil k dokumen terbaik di luar kandidat, yang skornya murni dari popularitas.
+
+    Args:
+        excluded (np.ndarray): Bitset dokumen yang sudah menjadi kandidat
+        k (int): Jumlah dokumen yang diminta
+        pop_weight (float): Bobot popularitas (1 - alpha)
+        popularity (np.ndarray): Popularitas ternormalisasi per dokumen
+        popularity_order (np.ndarray): Doc-id terurut menurut popularitas menurun
+        mask (np.ndarray): Bitset dokumen yang boleh masuk hasil
+        decay (np.ndarray): Faktor pengali skor per dokumen
+
+    Returns:
+        np.ndarray: Doc-id terurut menurut skor menurun, doc-id kecil didahulukan
+    """
+    remaining = popularity_order if pop_weight > 0 else np.arange(len(excluded))
+    remaining = remaining[~excluded[remaining]]
+    if mask is not None:
+        remaining = remaining[mask[remaining]]
+    # Dengan decay, urutan popularitas saja tidak lagi menentukan urutan skor
+    if decay is not None and pop_weight > 0:
+        scores = popularity[remaining] * decay[remaining]
+        if 0 < k < len(remaining):
+            # Cukup urutkan dokumen yang skornya tidak kalah dari skor ke-k
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            top = scores >= kth
+            remaining, scores = remaining[top], scores[top]
+        remaining = remaining[np.lexsort((remaining, -scores))]
+    return remaining[:k]
+
+class ImpactIndex:
+    """Posting list terurut berdasarkan impact untuk pencarian top-k.
+
+    Setiap posting list disimpan terurut menurut impact (menurun) dengan
+    doc-id terkompresi variable-byte dan impact terkuantisasi 8 bit yang
+    dibulatkan ke atas, sehingga tetap menjadi batas atas skor. Impact ini
+    hanya menentukan urutan penelusuran; skor lengkap dokumen dihitung melalui
+    random access ke index sumber. Bersama daftar dokumen yang terurut menurut
+    popularitas, pencarian dapat berhenti lebih awal ketika posting yang
+    tersisa tidak mungkin lagi mengalahkan top-k saat ini (threshold algorithm).
+    """
+
+    def __init__(self, term_ids, doc_ids, impacts, num_terms, num_docs):
+        """Membangun index dari daftar posting (term, dokumen, impact).
+
+        Args:
+            term_ids (np.ndarray): Term-id setiap posting
+            doc_ids (np.ndarray): Doc-id setiap posting
+            impacts (np.ndarray): Kontribusi skor setiap posting (non-negatif)
+            num_terms (int): Jumlah term dalam vocabulary
+            num_docs (int): Jumlah dokumen
+        """
+        self.num_docs = num_docs
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        impacts = np.asarray(impacts, dtype=np.float64)
+
+        self.offsets = np.zeros(num_terms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=num_terms), out=self.offsets[1:])
+
+        # Urutan impact menurun, doc-id kecil didahulukan bila impact sama
+        order = np.lexsort((doc_ids, -impacts, term_ids))
+        term_ids, doc_ids, impacts = term_ids[order], doc_ids[order], impacts[order]
+
+        # Batas atas skor setiap term untuk query planning
+        self.max_impacts = np.zeros(num_terms, dtype=np.float32)
+        nonempty = self.offsets[1:] > self.offsets[:-1]
+        self.max_impacts[nonempty] = impacts[self.offsets[:-1][nonempty]]
+
+        # Skala sedikit diperbesar agar pembulatan ke atas tidak melewati 255
+        self.impact_scales = self.max_impacts.astype(np.float64) / 255 * (1 + 1e-6)
+        scales = self.impact_scales[term_ids]
+        codes = np.zeros(len(impacts))
+        positive = scales > 0
+        codes[positive] = np.ceil(impacts[positive] / scales[positive] * (1 + 1e-9))
+        self.impact_codes = np.clip(codes, 0, 255).astype(np.uint8)
+
+        self.doc_bytes = vbyte_encode(doc_ids)
+        byte_ends = np.concatenate(([0], np.cumsum(vbyte_lengths(doc_ids))))
+        self.doc_byte_offsets = byte_ends[self.offsets]
+
+    @classmethod
+    def from_compressed(cls, index):
+        """Membangun index impact BM25 dari CompressedIndex."""
+        term_ids, doc_ids, impacts = [], [], []
+        for term_id in range(len(index.vocabulary)):
+            docs, scores = index.term_scores(term_id)
+            term_ids.append(np.full(len(docs), term_id))
+            doc_ids.append(docs)
+            impacts.append(scores)
+        return cls(np.concatenate(term_ids), np.concatenate(doc_ids), np.concatenate(impacts),
+                   len(index.vocabulary), index.num_docs)
+
+    @classmethod
+    def from_matrix(cls, X):
+        """Membangun index impact TF-IDF dari matriks sparse dokumen x term."""
+        coo = X.tocoo()
+        return cls(coo.col, coo.row, coo.data, X.shape[1], X.shape[0])
+
+    def _decode(self, term_id):
+        """Mendekompresi posting list sebuah term dalam urutan impact menurun.
+
+        Returns:
+            tuple: (doc_ids, batas atas impact) sebagai np.ndarray
+        """
+        start, end = self.doc_byte_offsets[term_id], self.doc_byte_offsets[term_id + 1]
+        docs = vbyte_decode(self.doc_bytes[start:end]).astype(np.int64)
+        codes = self.impact_codes[self.offsets[term_id]:self.offsets[term_id + 1]]
+        return docs, codes * self.impact_scales[term_id]
+
+    def nbytes(self):
+        """Menghitung ukuran total array index dalam byte."""
+        arrays = [self.offsets, self.max_impacts, self.impact_scales, self.impact_codes,
+                  self.doc_bytes, self.doc_byte_offsets]
+        return sum(a.nbytes for a in arrays)
+
+    def top_k(self, query_weights, k, score_docs, alpha=1.0, popularity=None, popularity_order=None,
+              norm=1.0, mask=None, decay=None, decay_order=None):
+        """Mencari k dokumen dengan skor kombinasi tertinggi.
+
+        Skor kombinasi dihitung sebagai
+        alpha * (sum bobot_term * impact) / norm + (1 - alpha) * popularitas,
+        sama seperti pencarian menyeluruh, tetapi posting dibaca per blok dan
+        pencarian berhenti ketika skor ke-k melebihi batas atas dokumen yang
+        belum terlihat. Jika norm None, pembagi adalah skor relevansi maksimum
+        dokumen yang lolos filter; nilainya pasti begitu skor relevansi
+        terbaik yang sudah terlihat tidak kalah dari batas atas dokumen yang
+        belum terlihat, sehingga tidak perlu penelusuran top-1 terpisah.
+
+        Args:
+            query_weights (dict): Bobot query per term-id
+            k (int): Jumlah dokumen yang diminta
+            score_docs (callable): Random access skor relevansi (sum bobot_term * impact)
+                untuk array doc-id, dihitung dari index sumber
+            alpha (float): Bobot skor relevansi
+            popularity (np.ndarray): Popularitas ternormalisasi (0-1) per dokumen
+            popularity_order (np.ndarray): Doc-id terurut menurut popularitas menurun
+            norm (float): Pembagi skor relevansi, None untuk skor relevansi maksimum
+            mask (np.ndarray): Bitset dokumen yang boleh masuk hasil
+            decay (np.ndarray): Faktor pengali skor kombinasi (0-1) per dokumen
+            decay_order (np.ndarray): Doc-id terurut menurut decay menurun; dokumen
+                yang tidak tercantum dianggap ber-decay 0
+
+        Returns:
+            tuple: (doc_ids, skor relevansi, skor kombinasi) terurut menurun
+        """
+        k = min(k, self.num_docs if mask is None else int(mask.sum()))
+        if k == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0)
+        terms = [(term_id, weight) for term_id, weight in query_weights.items()
+                 if self.offsets[term_id + 1] > self.offsets[term_id]]
+        # Posting list query didekompresi sekali, sisanya hanya slicing per blok
+        lists = [self._decode(term_id) for term_id, _ in terms]
+        pop_weight = (1 - alpha) if popularity is not None else 0.0
+        if popularity is None:
+            popularity = np.zeros(self.num_docs)
+            popularity_order = np.arange(self.num_docs)
+        if decay is not None and decay_order is None:
+            decay_order = np.argsort(-decay, kind='stable')
+
+        def combine(docs, rel, norm):
+            combined = alpha * rel / norm + pop_weight * popularity[docs]
+            return combined * decay[docs] if decay is not None else combined
+
+        seen = np.zeros(self.num_docs, dtype=bool)
+        cand_docs, cand_rel = [], []
+        frontiers = np.zeros(len(terms))
+        depth = 0
+
+        while True:
+            blocks = []
+            exhausted = True
+            for i, (term_docs, term_impacts) in enumerate(lists):
+                end = len(term_docs)
+                lo, hi = depth, min(depth + IMPACT_BLOCK_SIZE, end)
+                if lo < hi:
+                    blocks.append(term_docs[lo:hi])
+                # Dokumen yang belum terlihat paling tinggi bernilai impact terakhir yang dibaca
+                frontiers[i] = term_impacts[hi - 1] if hi < end else 0.0
+                exhausted &= hi >= end
+
+            pop_frontier = 0.0
+            if pop_weight > 0 and not exhausted:
+                block = popularity_order[depth:depth + IMPACT_BLOCK_SIZE]
+                blocks.append(block)
+                end = depth + IMPACT_BLOCK_SIZE
+                pop_frontier = popularity[popularity_order[end - 1]] if end <= self.num_docs else 0.0
+
+            # Dokumen juga dibaca menurut decay (terbaru dahulu) agar batas atas ikut mengecil
+            decay_frontier = 1.0
+            if decay is not None and not exhausted:
+                blocks.append(decay_order[depth:depth + IMPACT_BLOCK_SIZE])
+                end = depth + IMPACT_BLOCK_SIZE
+                decay_frontier = decay[decay_order[end - 1]] if end <= len(decay_order) else 0.0
+            depth += IMPACT_BLOCK_SIZE
+
+            # Hitung skor lengkap dokumen baru melalui random access
+            if blocks:
+                docs = np.unique(np.concatenate(blocks))
+                docs = docs[~seen[docs]]
+                seen[docs] = True
+                # Bitset filter diterapkan sebelum random access
+                if mask is not None:
+                    docs = docs[mask[docs]]
+                cand_docs.append(docs)
+                cand_rel.append(score_docs(docs) if len(docs) else np.zeros(0))
+
+            if exhausted:
+                # Dokumen sisanya tidak memuat term query, skornya murni popularitas
+                rest = top_unscored(seen, k, pop_weight, popularity, popularity_order, mask, decay)
+                cand_docs.append(rest)
+                cand_rel.append(np.zeros(len(rest)))
+                break
+
+            docs = np.concatenate(cand_docs)
+            rel = np.concatenate(cand_rel)
+            rel_bound = float(np.dot([w for _, w in terms], frontiers))
+            if norm is None:
+                # Pembagi baru pasti jika dokumen yang belum terlihat tidak dapat melampauinya
+                best = rel.max() if len(rel) else 0.0
+                if best < rel_bound:
+                    continue
+                norm = best if best > 0 else 1.0
+            if len(docs) >= k:
+                combined = combine(docs, rel, norm)
+                kth = np.partition(combined, len(combined) - k)[len(combined) - k]
+                threshold = alpha * rel_bound / norm + pop_weight * pop_frontier
+                # Dokumen yang belum terlihat memiliki decay paling tinggi decay_frontier
+                threshold *= decay_frontier
+                if kth > threshold:
+                    break
+
+        docs = np.concatenate(cand_docs).astype(np.int64)
+        rel = np.concatenate(cand_rel)
+        if norm is None:
+            # Semua posting sudah dibaca, maksimum kandidat adalah maksimum sebenarnya
+            norm = rel.max() if len(rel) and rel.max() > 0 else 1.0
+        combined = combine(docs, rel, norm)
+        order = np.lexsort((docs, -combined))[:k]
+        return docs[order], rel[order], combined[order]
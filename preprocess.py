@@ -1,8 +1,9 @@
 import re
-from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
 
-factory = StemmerFactory()
-stemmer = factory.create_stemmer()
+# Hasil stemming per kata. Cache ini disimpan bersama model sehingga query
+# yang hanya memuat kata dari corpus tidak perlu membuat stemmer Sastrawi
+stem_cache = {}
+_stemmer = None
 
 # Stopword list (bisa diperluas sesuai kebutuhan)
 stopwords = set([
@@ -11,6 +12,25 @@ stopwords = set([
     'juga', 'dalam', 'akan', 'telah', 'tidak', 'bagi', 'oleh', 'karena'
 ])
 
+def get_stemmer():
+    """Membuat stemmer Sastrawi saat pertama kali dibutuhkan."""
+    global _stemmer
+    if _stemmer is None:
+        from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+        _stemmer = StemmerFactory().create_stemmer()
+    return _stemmer
+
+def stem_word(word):
+    """Stemming satu kata, memakai cache jika kata sudah pernah di-stem."""
+    stem = stem_cache.get(word)
+    if stem is None:
+        stem = stem_cache[word] = get_stemmer().stem(word)
+    return stem
+
+def load_stem_cache(snapshot):
+    """Memuat snapshot hasil stemming (misal dari file model) ke cache."""
+    stem_cache.update(snapshot)
+
 def clean_text(text):
     print("Starting to clean text...")
     # Convert to lowercase
@@ -21,7 +41,8 @@ def clean_text(text):
     text = re.sub(r'\s+', ' ', text).strip()
     # Apply stemming if text is not empty
     if text:
-        cleaned = stemmer.stem(text)
+        # Stemming per kata, sama dengan stemmer Sastrawi untuk teks yang sudah dinormalisasi
+        cleaned = ' '.join(stem_word(word) for word in text.split(' '))
         
         # Tokenization (split into words)
         tokens = cleaned.split()
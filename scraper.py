@@ -2,17 +2,108 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import logging
+from dedup import DuplicateIndex
 
 # Konfigurasi logging
 logging.basicConfig(
-    level=logging.DEBUG,  # Ubah ke DEBUG untuk informasi lebih detail
+    level=logging.INFO,  # Ubah ke DEBUG untuk informasi lebih detail
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
 BASE_URL = "https://dispmd.bulelengkab.go.id"
 
+# Lewati artikel baru yang merupakan near-duplicate dari artikel yang sudah ada.
+# Default False: artikel serupa (misal kegiatan rutin mingguan) tetap disimpan
+# dan hanya diringkas saat pencarian
+SKIP_NEAR_DUPLICATES = False
+
+# Parser HTML: lxml (opsional, tidak termasuk requirements.txt) jauh lebih cepat
+# dari html.parser bawaan Python jika terpasang
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Jumlah thread parsing HTML yang berjalan selagi halaman berikutnya diunduh
+PARSE_WORKERS = 2
+
+# Selector kandidat untuk setiap bagian halaman, dicoba berurutan. Selector
+# di depan khusus template situs, sisanya fallback umum (misal 'h3')
+LIST_SELECTORS = [
+    'div.berita a',  # Original selector
+    'div.artikel a',  # Alternative selector
+    'a[href*="/informasi/detail/berita"]',  # Direct link selector
+    '.content-berita a'  # Content area selector
+]
+TITLE_SELECTORS = [
+    'h3.judul-konten',
+    '.judul-konten',
+    'div.col-md-8 h3',
+    'h3',
+    '.content-berita h3'
+]
+CONTENT_SELECTORS = [
+    'div.isi-konten p',
+    '.konten p',
+    'div.col-md-8 p',
+    '.content-berita p',
+    'article p',
+    '.berita p'
+]
+DATE_SELECTORS = [
+    'div.text-muted',
+    '.tanggal',
+    '.date-info',
+    '.content-berita .text-muted',
+    'time'
+]
+
+# Jumlah selector khusus template di awal daftar yang boleh di-cache
+TITLE_TEMPLATE_SELECTORS = 2
+CONTENT_TEMPLATE_SELECTORS = 2
+DATE_TEMPLATE_SELECTORS = 1
+
+# Selector khusus template yang terakhir berhasil untuk setiap bagian halaman situs ini
+_selector_cache = {}
+
+def debug_enabled():
+    """Cek level DEBUG agar pesan debug yang mahal tidak dibuat jika tidak dicetak."""
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+def select_cached(soup, field, selectors, template_count, many=False):
+    """Mencari elemen dengan selector khusus template yang terakhir berhasil terlebih dahulu.
+    
+    Halaman dari satu situs memakai template yang sama, sehingga selector
+    template yang cocok di satu halaman hampir selalu cocok di halaman
+    berikutnya. Hanya selector template yang di-cache: fallback umum seperti
+    'h3' dapat mengenai elemen lain (misal judul sidebar), sehingga tetap
+    dicoba sesuai prioritas.
+    
+    Args:
+        soup (BeautifulSoup): Dokumen HTML
+        field (str): Nama bagian halaman sebagai kunci cache
+        selectors (list): Selector CSS kandidat sesuai prioritas
+        template_count (int): Jumlah selector khusus template di awal daftar
+        many (bool): Ambil semua elemen yang cocok, bukan hanya yang pertama
+        
+    Returns:
+        tuple: (selector yang berhasil, hasil), (None, None/[]) jika semua gagal
+    """
+    cached = _selector_cache.get(field)
+    ordered = [cached] + [s for s in selectors if s != cached] if cached else selectors
+    for selector in ordered:
+        result = soup.select(selector) if many else soup.select_one(selector)
+        if result:
+            if selector in selectors[:template_count]:
+                _selector_cache[field] = selector
+            return selector, result
+    return None, [] if many else None
+
 def scrape_article_list(max_pages=3):
     all_urls = []
     max_retries = 3
@@ -26,40 +117,32 @@ def scrape_article_list(max_pages=3):
     while True:
         # Cek batasan halaman jika max_pages > 0
         if max_pages > 0 and page > max_pages:
-            logging.info(f"Mencapai batas maksimum halaman ({max_pages})")
+            logging.info("Mencapai batas maksimum halaman (%d)", max_pages)
             break
             
         try:
             # Akses halaman dengan nomor halaman
             page_url = f"{BASE_URL}/informasi/tampil/berita?page_v_konten={page}"
-            logging.info(f"Mengambil daftar artikel dari halaman {page}: {page_url}")
+            logging.info("Mengambil daftar artikel dari halaman %d: %s", page, page_url)
             
             response = requests.get(page_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            logging.debug(f"HTML Response untuk halaman {page}:\n{soup.prettify()[:1000]}...")
-            
-            # Cek apakah halaman menampilkan "BELUM ADA DATA"
-            no_data_text = soup.find(string=lambda text: "BELUM ADA DATA" in str(text) if text else False)
-            if no_data_text:
-                logging.info(f"Mencapai akhir data pada halaman {page}")
+            # Cek apakah halaman menampilkan "BELUM ADA DATA" sebelum parsing
+            if "BELUM ADA DATA" in response.text:
+                logging.info("Mencapai akhir data pada halaman %d", page)
                 break
             
-            # Coba beberapa selector untuk menemukan artikel
-            article_links = []
-            selectors = [
-                'div.berita a',  # Original selector
-                'div.artikel a',  # Alternative selector
-                'a[href*="/informasi/detail/berita"]',  # Direct link selector
-                '.content-berita a'  # Content area selector
-            ]
+            logging.debug("HTML Response untuk halaman %d:\n%s...", page, response.text[:1000])
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
-            for selector in selectors:
+            # Coba beberapa selector untuk menemukan artikel, hasil semua selector digabung
+            article_links = []
+            for selector in LIST_SELECTORS:
                 links = soup.select(selector)
                 if links:
                     article_links.extend(links)
-                    logging.debug(f"Menemukan {len(links)} link dengan selector '{selector}'")
+                    logging.debug("Menemukan %d link dengan selector '%s'", len(links), selector)
             
             found_articles = False
             for link in article_links:
@@ -67,130 +150,153 @@ def scrape_article_list(max_pages=3):
                     article_url = BASE_URL + link['href'] if link['href'].startswith('/') else link['href']
                     if article_url not in all_urls:
                         all_urls.append(article_url)
-                        logging.info(f"Menemukan artikel baru: {link.text.strip() or 'Tanpa judul'}")
+                        logging.info("Menemukan artikel baru: %s", link.text.strip() or 'Tanpa judul')
                         found_articles = True
             
             if found_articles:
                 page += 1  # Lanjut ke halaman berikutnya
-                logging.info(f"Berhasil mengambil artikel dari halaman {page-1}, melanjutkan ke halaman berikutnya")
+                logging.info("Berhasil mengambil artikel dari halaman %d, melanjutkan ke halaman berikutnya", page - 1)
             else:
-                logging.warning(f"Tidak menemukan link artikel pada halaman {page}")
+                logging.warning("Tidak menemukan link artikel pada halaman %d", page)
                 # Periksa apakah ini karena format halaman yang berbeda
-                logging.debug("Struktur HTML halaman:")
-                logging.debug(soup.select('div.berita'))
+                if debug_enabled():
+                    logging.debug("Struktur HTML halaman:")
+                    logging.debug(soup.select('div.berita'))
                 break
             
             # Tunggu sebentar sebelum mengambil halaman berikutnya
             time.sleep(2)
             
         except requests.RequestException as e:
-            logging.error(f"Gagal mengambil halaman {page}: {str(e)}")
+            logging.error("Gagal mengambil halaman %d: %s", page, e)
             if page == 1:  # Jika gagal pada halaman pertama, return langsung
                 return all_urls
             break  # Jika gagal pada halaman selanjutnya, hentikan paginasi
         except Exception as e:
-            logging.error(f"Error tidak terduga pada halaman {page}: {str(e)}")
-            logging.debug(f"Traceback:", exc_info=True)
+            logging.error("Error tidak terduga pada halaman %d: %s", page, e)
+            logging.debug("Traceback:", exc_info=True)
             break
     
-    logging.info(f"Total artikel yang ditemukan: {len(all_urls)}")
+    logging.info("Total artikel yang ditemukan: %d", len(all_urls))
     return all_urls
 
-def scrape_article_detail(url):
-    max_retries = 3
+def fetch_html(url, max_retries=3):
+    """Mengunduh HTML sebuah halaman artikel dengan retry.
+    
+    Exception percobaan terakhir diteruskan ke pemanggil tanpa dicetak agar
+    kegagalan tidak dilaporkan dua kali.
+    """
     for attempt in range(max_retries):
         try:
-            logging.info(f"Mengambil artikel dari {url} (Percobaan {attempt + 1})")
+            logging.info("Mengambil artikel dari %s (Percobaan %d)", url, attempt + 1)
             r = requests.get(url, timeout=30)
             r.raise_for_status()
-            
-            soup = BeautifulSoup(r.text, 'html.parser')
-            logging.debug(f"HTML Response untuk artikel:\n{soup.prettify()[:1000]}...")
-            
-            # Coba beberapa selector untuk judul
-            title_selectors = [
-                'h3.judul-konten',
-                '.judul-konten',
-                'div.col-md-8 h3',
-                'h3',
-                '.content-berita h3'
-            ]
-            title_elem = None
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    logging.debug(f"Judul ditemukan dengan selector: {selector}")
-                    break
-            
-            if not title_elem:
-                logging.error("Judul tidak ditemukan dengan semua selector yang dicoba")
-                raise ValueError("Judul artikel tidak ditemukan")
-            
-            title = title_elem.text.strip()
-            logging.debug(f"Judul artikel: {title}")
-            
-            # Coba beberapa selector untuk konten
-            content_selectors = [
-                'div.isi-konten p',
-                '.konten p',
-                'div.col-md-8 p',
-                '.content-berita p',
-                'article p',
-                '.berita p'
-            ]
-            content = ""
-            for selector in content_selectors:
-                paragraphs = soup.select(selector)
-                if paragraphs:
-                    logging.debug(f"Konten ditemukan dengan selector: {selector} ({len(paragraphs)} paragraf)")
-                    content = " ".join([p.text.strip() for p in paragraphs])
-                    break
-            
-            if not content:
-                logging.error("Konten tidak ditemukan dengan semua selector yang dicoba")
-                logging.debug("Mencoba mencari semua paragraf dalam dokumen...")
-                all_paragraphs = soup.find_all('p')
-                if all_paragraphs:
-                    content = " ".join([p.text.strip() for p in all_paragraphs])
-                    logging.debug(f"Menemukan {len(all_paragraphs)} paragraf dengan pencarian umum")
-                else:
-                    raise ValueError("Konten artikel tidak ditemukan")
-            
-            # Coba beberapa selector untuk tanggal
-            date_selectors = [
-                'div.text-muted',
-                '.tanggal',
-                '.date-info',
-                '.content-berita .text-muted',
-                'time'
-            ]
-            date_elem = None
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    logging.debug(f"Tanggal ditemukan dengan selector: {selector}")
-                    break
-            
-            date_info = date_elem.text.strip() if date_elem else "Tanggal tidak tersedia"
-            logging.debug(f"Informasi tanggal: {date_info}")
-            
-            logging.info(f"Berhasil mengambil artikel: {title}")
-            return {
-                "judul": title,
-                "url": url,
-                "konten": content,
-                "tanggal": date_info
-            }
-            
+            return r.text
         except requests.RequestException as e:
             if attempt == max_retries - 1:
-                print(f"Gagal mengambil artikel dari {url} setelah {max_retries} percobaan: {str(e)}")
                 raise
             print(f"Percobaan {attempt + 1} gagal, mencoba lagi...")
             time.sleep(2)
-        except Exception as e:
-            print(f"Error saat mengambil artikel dari {url}: {str(e)}")
-            raise
+
+def parse_article_detail(html, url):
+    """Mengekstrak judul, konten, dan tanggal dari HTML halaman artikel.
+    
+    Args:
+        html (str): HTML halaman artikel
+        url (str): URL artikel
+        
+    Returns:
+        dict: Artikel dengan field judul, url, konten, dan tanggal
+    """
+    logging.debug("HTML Response untuk artikel:\n%s...", html[:1000])
+    soup = BeautifulSoup(html, HTML_PARSER)
+    
+    # Coba beberapa selector untuk judul
+    selector, title_elem = select_cached(soup, 'title', TITLE_SELECTORS, TITLE_TEMPLATE_SELECTORS)
+    if not title_elem:
+        logging.error("Judul tidak ditemukan dengan semua selector yang dicoba")
+        raise ValueError("Judul artikel tidak ditemukan")
+    logging.debug("Judul ditemukan dengan selector: %s", selector)
+    
+    title = title_elem.text.strip()
+    logging.debug("Judul artikel: %s", title)
+    
+    # Coba beberapa selector untuk konten
+    selector, paragraphs = select_cached(soup, 'content', CONTENT_SELECTORS, CONTENT_TEMPLATE_SELECTORS, many=True)
+    content = ""
+    if paragraphs:
+        logging.debug("Konten ditemukan dengan selector: %s (%d paragraf)", selector, len(paragraphs))
+        content = " ".join([p.text.strip() for p in paragraphs])
+    
+    if not content:
+        logging.error("Konten tidak ditemukan dengan semua selector yang dicoba")
+        logging.debug("Mencoba mencari semua paragraf dalam dokumen...")
+        all_paragraphs = soup.find_all('p')
+        if all_paragraphs:
+            content = " ".join([p.text.strip() for p in all_paragraphs])
+            logging.debug("Menemukan %d paragraf dengan pencarian umum", len(all_paragraphs))
+        else:
+            raise ValueError("Konten artikel tidak ditemukan")
+    
+    # Coba beberapa selector untuk tanggal
+    selector, date_elem = select_cached(soup, 'date', DATE_SELECTORS, DATE_TEMPLATE_SELECTORS)
+    if date_elem:
+        logging.debug("Tanggal ditemukan dengan selector: %s", selector)
+    
+    date_info = date_elem.text.strip() if date_elem else "Tanggal tidak tersedia"
+    logging.debug("Informasi tanggal: %s", date_info)
+    
+    logging.info("Berhasil mengambil artikel: %s", title)
+    return {
+        "judul": title,
+        "url": url,
+        "konten": content,
+        "tanggal": date_info
+    }
+
+def scrape_article_detail(url):
+    try:
+        return parse_article_detail(fetch_html(url), url)
+    except Exception as e:
+        print(f"Error saat mengambil artikel dari {url}: {str(e)}")
+        raise
+
+def scrape_articles(urls, workers=PARSE_WORKERS):
+    """Mengambil banyak artikel dengan parsing HTML yang tumpang tindih dengan unduhan.
+    
+    Halaman diunduh berurutan seperti sebelumnya, tetapi setiap HTML langsung
+    diserahkan ke thread pool untuk diparse sementara halaman berikutnya
+    diunduh. Hasil dikembalikan sesuai urutan urls.
+    
+    Args:
+        urls (list): URL artikel
+        workers (int): Jumlah thread parsing
+        
+    Yields:
+        tuple: (url, artikel, error); artikel None dan error berisi exception jika gagal
+    """
+    pending = deque()
+    
+    def finished(wait):
+        # Keluarkan hasil terdepan yang sudah selesai (atau semuanya jika wait) agar urutan tetap
+        while pending and (wait or isinstance(pending[0][1], Exception) or pending[0][1].done()):
+            url, job = pending.popleft()
+            if isinstance(job, Exception):
+                yield url, None, job
+                continue
+            try:
+                yield url, job.result(), None
+            except Exception as e:
+                yield url, None, e
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for url in urls:
+            try:
+                pending.append((url, pool.submit(parse_article_detail, fetch_html(url), url)))
+            except Exception as e:
+                pending.append((url, e))
+            yield from finished(wait=False)
+        yield from finished(wait=True)
 
 def main():
     # Baca artikel yang sudah ada
@@ -206,19 +312,35 @@ def main():
     # Simpan URL yang sudah ada
     existing_urls = {article['url'] for article in existing_articles}
     
+    # Index MinHash/LSH untuk mendeteksi rilis yang dipublikasikan ulang di URL berbeda
+    duplicate_index = DuplicateIndex()
+    indexed_urls = []
+    for article in existing_articles:
+        duplicate_index.add(article.get('konten', ''))
+        indexed_urls.append(article['url'])
+    skipped_duplicates = 0
+    
     # Ambil URL artikel baru dengan batasan halaman
     urls = scrape_article_list(max_pages)
     
     # Proses hanya artikel yang belum ada
     new_articles = []
-    for url in urls:
-        if url not in existing_urls:
-            try:
-                article = scrape_article_detail(url)
-                new_articles.append(article)
-                print(f"Berhasil menambahkan artikel: {article['judul']}")
-            except Exception as e:
-                print(f"Gagal mengambil artikel dari {url}: {str(e)}")
+    new_urls = [url for url in urls if url not in existing_urls]
+    for url, article, error in scrape_articles(new_urls):
+        if error is not None:
+            print(f"Gagal mengambil artikel dari {url}: {str(error)}")
+            continue
+        signature = duplicate_index.signature(article['konten'])
+        duplicates = duplicate_index.query(signature)
+        if duplicates:
+            print(f"Artikel {url} adalah near-duplicate dari {indexed_urls[duplicates[0]]}")
+            if SKIP_NEAR_DUPLICATES:
+                skipped_duplicates += 1
+                continue
+        duplicate_index.insert(signature)
+        indexed_urls.append(url)
+        new_articles.append(article)
+        print(f"Berhasil menambahkan artikel: {article['judul']}")
     
     # Gabungkan artikel lama dan baru
     all_articles = existing_articles + new_articles
@@ -229,6 +351,7 @@ def main():
     
     print(f"\nTotal artikel yang sudah ada: {len(existing_articles)}")
     print(f"Artikel baru yang ditambahkan: {len(new_articles)}")
+    print(f"Artikel near-duplicate yang dilewati: {skipped_duplicates}")
     print(f"Total artikel sekarang: {len(all_articles)}")
 
 
@@ -0,0 +1,171 @@
+import numpy as np
+from postings import top_unscored
+
+# Jumlah iterasi k-means saat melatih centroid IVF
+KMEANS_ITERATIONS = 20
+
+# Jumlah baris yang diproses sekaligus agar memori tetap kecil untuk corpus besar
+CHUNK_SIZE = 4096
+
+def normalize_rows(vectors):
+    """Menormalisasi setiap baris ke panjang L2 = 1 (baris nol dibiarkan)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+def spherical_kmeans(vectors, n_clusters, iterations=KMEANS_ITERATIONS, seed=42):
+    """Melatih centroid k-means berbasis cosine similarity.
+
+    Args:
+        vectors (np.ndarray): Vektor ternormalisasi L2
+        n_clusters (int): Jumlah cluster
+        iterations (int): Jumlah iterasi
+        seed (int): Seed untuk inisialisasi centroid
+
+    Returns:
+        np.ndarray: Centroid ternormalisasi L2 berukuran (n_clusters, dim)
+    """
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        labels = np.argmax(vectors @ centroids.T, axis=1)
+        for c in range(n_clusters):
+            members = vectors[labels == c]
+            # Cluster kosong diisi ulang dengan vektor acak
+            centroids[c] = members.sum(axis=0) if len(members) else vectors[rng.integers(len(vectors))]
+        centroids = normalize_rows(centroids)
+    return centroids
+
+class LSAIndex:
+    """Index semantik laten (LSA) dengan approximate nearest neighbour IVF.
+
+    Matriks TF-IDF diproyeksikan ke ruang laten berdimensi rendah dengan
+    TruncatedSVD. Vektor dokumen disimpan sebagai matriks float32 di file .npy
+    yang dibaca melalui memory map, sedangkan pencarian hanya menghitung dot
+    product terhadap dokumen di beberapa cluster (inverted file) terdekat.
+    """
+
+    def __init__(self, X, vectors_file, n_components=100, n_lists=None, nprobe=8, seed=42):
+        """Membangun index dari matriks TF-IDF.
+
+        Args:
+            X (scipy.sparse.csr_matrix): Matriks TF-IDF dokumen x term
+            vectors_file (str): Path file .npy untuk vektor dokumen
+            n_components (int): Dimensi ruang laten
+            n_lists (int): Jumlah cluster IVF, default akar jumlah dokumen
+            nprobe (int): Jumlah cluster yang diperiksa saat pencarian
+            seed (int): Seed untuk SVD dan k-means
+        """
+        # scikit-learn hanya dibutuhkan saat membangun index, bukan saat pencarian
+        from sklearn.decomposition import TruncatedSVD
+
+        num_docs, num_terms = X.shape
+        n_components = max(1, min(n_components, num_docs - 1, num_terms - 1))
+        n_lists = n_lists or max(1, int(np.sqrt(num_docs)))
+        self.vectors_file = vectors_file
+        self.nprobe = nprobe
+        self.num_docs = num_docs
+
+        svd = TruncatedSVD(n_components=n_components, random_state=seed)
+        svd.fit(X)
+        # Cukup simpan matriks proyeksi, query diproyeksikan tanpa objek sklearn
+        self.components = svd.components_.astype(np.float32)
+
+        # Tulis vektor dokumen per blok langsung ke file memory-mapped
+        vectors = np.lib.format.open_memmap(vectors_file, mode='w+', dtype=np.float32,
+                                            shape=(num_docs, n_components))
+        for start in range(0, num_docs, CHUNK_SIZE):
+            block = X[start:start + CHUNK_SIZE] @ self.components.T
+            vectors[start:start + CHUNK_SIZE] = normalize_rows(np.asarray(block))
+        vectors.flush()
+        del vectors
+        self._vectors = None
+
+        # Latih centroid dari sampel lalu tetapkan seluruh dokumen ke cluster terdekat
+        vectors = self.vectors
+        rng = np.random.default_rng(seed)
+        sample_size = min(num_docs, 256 * n_lists)
+        sample = vectors[np.sort(rng.choice(num_docs, sample_size, replace=False))]
+        self.centroids = spherical_kmeans(np.asarray(sample), n_lists, seed=seed).astype(np.float32)
+
+        labels = np.concatenate([
+            np.argmax(vectors[start:start + CHUNK_SIZE] @ self.centroids.T, axis=1)
+            for start in range(0, num_docs, CHUNK_SIZE)
+        ])
+        order = np.argsort(labels, kind='stable')
+        self.list_docs = order.astype(np.int32)
+        self.list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=n_lists), out=self.list_offsets[1:])
+
+    def __getstate__(self):
+        # Memory map tidak ikut di-pickle, dibuka ulang saat dibutuhkan
+        state = self.__dict__.copy()
+        state['_vectors'] = None
+        return state
+
+    @property
+    def vectors(self):
+        """Matriks vektor dokumen (memory-mapped, read-only)."""
+        if self._vectors is None:
+            self._vectors = np.load(self.vectors_file, mmap_mode='r')
+        return self._vectors
+
+    def project(self, query_vec):
+        """Memproyeksikan vektor TF-IDF query (QueryVector) ke ruang laten."""
+        latent = self.components[:, query_vec.indices] @ query_vec.data.astype(np.float32)
+        norm = np.linalg.norm(latent)
+        return latent / norm if norm > 0 else latent
+
+    def candidates(self, latent, nprobe=None):
+        """Mengambil doc-id dari nprobe cluster yang centroidnya paling mirip dengan query."""
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ latent), nprobe - 1)[:nprobe]
+        return np.sort(np.concatenate([
+            self.list_docs[self.list_offsets[c]:self.list_offsets[c + 1]] for c in lists
+        ]))
+
+    def top_k(self, query_vec, k, alpha=1.0, popularity=None, popularity_order=None, nprobe=None,
+              mask=None, decay=None):
+        """Mencari k dokumen dengan skor kombinasi tertinggi.
+
+        Similarity hanya dihitung untuk dokumen kandidat IVF. Dokumen lain dan
+        dokumen dengan cosine negatif dianggap bersimilarity 0 sehingga skornya
+        murni dari popularitas.
+
+        Args:
+            query_vec (QueryVector): Vektor TF-IDF query
+            k (int): Jumlah dokumen yang diminta
+            alpha (float): Bobot skor similarity
+            popularity (np.ndarray): Popularitas ternormalisasi (0-1) per dokumen
+            popularity_order (np.ndarray): Doc-id terurut menurut popularitas menurun
+            nprobe (int): Jumlah cluster yang diperiksa
+            mask (np.ndarray): Bitset dokumen yang boleh masuk hasil
+            decay (np.ndarray): Faktor pengali skor kombinasi (0-1) per dokumen
+
+        Returns:
+            tuple: (doc_ids, similarity, skor kombinasi) terurut menurun
+        """
+        k = min(k, self.num_docs if mask is None else int(mask.sum()))
+        latent = self.project(query_vec)
+        docs = self.candidates(latent, nprobe) if latent.any() else np.zeros(0, dtype=np.int64)
+        is_candidate = np.zeros(self.num_docs, dtype=bool)
+        is_candidate[docs] = True
+        if mask is not None:
+            docs = docs[mask[docs]]
+        similarity = np.maximum(self.vectors[docs] @ latent, 0).astype(np.float64)
+
+        pop_weight = (1 - alpha) if popularity is not None else 0.0
+        if popularity is None:
+            popularity = np.zeros(self.num_docs)
+            popularity_order = np.arange(self.num_docs)
+
+        # Tambahkan dokumen non-kandidat terbaik yang mungkin masuk top-k
+        rest = top_unscored(is_candidate, k, pop_weight, popularity, popularity_order, mask, decay)
+
+        docs = np.concatenate((docs, rest)).astype(np.int64)
+        similarity = np.concatenate((similarity, np.zeros(len(rest))))
+        combined = alpha * similarity + pop_weight * popularity[docs]
+        if decay is not None:
+            combined *= decay[docs]
+        order = np.lexsort((docs, -combined))[:k]
+        return docs[order], similarity[order], combined[order]
@@ -0,0 +1,100 @@
+import re
+from collections import namedtuple
+import numpy as np
+
+# Pola token default TfidfVectorizer scikit-learn
+TOKEN_PATTERN = re.compile(r'(?u)\b\w\w+\b')
+
+# Vektor TF-IDF query dalam bentuk sparse: indeks term terurut dan bobotnya
+QueryVector = namedtuple('QueryVector', ['indices', 'data'])
+
+class TfidfQueryVectorizer:
+    """Transformasi TF-IDF query tanpa scikit-learn.
+
+    Hanya menyimpan vocabulary dan bobot idf hasil TfidfVectorizer sehingga
+    memuat model untuk pencarian tidak perlu mengimpor scikit-learn dan SciPy.
+    Hasil transform sama dengan TfidfVectorizer default (lowercase, token
+    minimal dua karakter, tf x idf, normalisasi L2).
+    """
+
+    def __init__(self, vocabulary, idf, dtype=np.float32):
+        """
+        Args:
+            vocabulary (dict): Pemetaan term ke indeks kolom
+            idf (np.ndarray): Bobot idf per kolom
+            dtype (type): Tipe data bobot
+        """
+        self.vocabulary = vocabulary
+        self.idf = np.asarray(idf, dtype=dtype)
+
+    @classmethod
+    def from_sklearn(cls, vectorizer):
+        """Mengambil vocabulary dan idf dari TfidfVectorizer yang sudah di-fit."""
+        vocabulary = {term: int(i) for term, i in vectorizer.vocabulary_.items()}
+        return cls(vocabulary, vectorizer.idf_, vectorizer.dtype)
+
+    def transform(self, text):
+        """Menghitung vektor TF-IDF sebuah query.
+
+        Returns:
+            QueryVector: Indeks term terurut dan bobot ternormalisasi L2
+        """
+        ids = [self.vocabulary[t] for t in TOKEN_PATTERN.findall(text.lower()) if t in self.vocabulary]
+        indices, counts = np.unique(np.array(ids, dtype=np.int32), return_counts=True)
+        data = counts.astype(self.idf.dtype) * self.idf[indices]
+        norm = np.linalg.norm(data)
+        if norm > 0:
+            data /= norm
+        return QueryVector(indices, data)
+
+class DocumentMatrix:
+    """Matriks TF-IDF dokumen x term (CSR) untuk random access baris tanpa SciPy.
+
+    Dibaca langsung dari file .npz hasil scipy.sparse.save_npz, sehingga
+    skor dokumen kandidat pencarian top-k dapat dihitung tanpa mengimpor SciPy.
+    """
+
+    def __init__(self, indptr, indices, data):
+        """
+        Args:
+            indptr (np.ndarray): Offset awal setiap baris
+            indices (np.ndarray): Indeks kolom setiap nilai, terurut per baris
+            data (np.ndarray): Nilai TF-IDF
+        """
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+
+    @classmethod
+    def load(cls, path):
+        """Membaca matriks dari file .npz (format CSR) tanpa SciPy."""
+        with np.load(path) as f:
+            return cls(f['indptr'], f['indices'], f['data'])
+
+    @classmethod
+    def from_sparse(cls, X):
+        """Memakai array dari matriks scipy.sparse CSR yang sudah ada di memori."""
+        return cls(X.indptr, X.indices, X.data)
+
+    def dot(self, docs, query_vec):
+        """Menghitung dot product baris dokumen dengan vektor query.
+
+        Args:
+            docs (np.ndarray): Doc-id yang dihitung
+            query_vec (QueryVector): Vektor TF-IDF query
+
+        Returns:
+            np.ndarray: Skor setiap dokumen (cosine jika baris dan query ternormalisasi L2)
+        """
+        starts = self.indptr[docs]
+        lengths = self.indptr[docs + 1] - starts
+        total = int(lengths.sum())
+        if total == 0 or len(query_vec.indices) == 0:
+            return np.zeros(len(docs))
+        rows = np.repeat(np.arange(len(docs)), lengths)
+        positions = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths - starts, lengths)
+        cols = self.indices[positions]
+        slots = np.minimum(np.searchsorted(query_vec.indices, cols), len(query_vec.indices) - 1)
+        found = query_vec.indices[slots] == cols
+        weights = self.data[positions[found]].astype(np.float64) * query_vec.data[slots[found]]
+        return np.bincount(rows[found], weights=weights, minlength=len(docs))